@@ -1,9 +1,18 @@
+import collections
+import concurrent.futures
+import fcntl
 import functools
+import hashlib
 import os
+import pickle
+import shutil
+import tempfile
 import urllib.parse
 import enum
 import subprocess
 import datetime
+from types import TracebackType
+from typing import Dict, List, Optional, TextIO, Tuple, Type
 
 import git
 
@@ -13,11 +22,10 @@ from .config import config
 from .utils import listify, min_datetime, max_datetime
 
 
-try:
-    subprocess.run
-except AttributeError:
-    from .subprocess_run import run
-    subprocess.run = run
+@functools.lru_cache(maxsize=128)
+def _expanduser(path: str) -> str:
+    """Memoised variant of ``os.path.expanduser()``."""
+    return os.path.expanduser(path)
 
 
 def build(depends=None, master=None):
@@ -65,21 +73,18 @@ class Build(Dependency, Constructible, Artefactor, WrapperRun, Runnable):
         self.depends(*listify(depends, none_empty=True))
 
     def _run(self):
-        all_change_info = ChangeInfo(
-            ChangeInfo.Status.UNCHANGED,
-            min_datetime,
-        )
+        all_change_info = ChangeInfo(_UNCHANGED, min_datetime)
 
-        for source in self._sources:
-            change_info = source.scan()
+        with concurrent.futures.ThreadPoolExecutor(
+                max(1, len(self._sources))) as pool:
+            change_infos = list(pool.map(lambda s: s.scan(), self._sources))
 
-            if change_info.status is ChangeInfo.Status.UNCHANGED:
-                pass
-            elif change_info.status is ChangeInfo.Status.UNKNOWN:
-                if all_change_info.status is not ChangeInfo.Status.CHANGED:
-                    all_change_info.status = ChangeInfo.Status.UNKNOWN
-            elif change_info.status is ChangeInfo.Status.CHANGED:
-                all_change_info.status = ChangeInfo.Status.CHANGED
+        for change_info in change_infos:
+            all_change_info.status = max(
+                all_change_info.status,
+                change_info.status,
+                key=_status_precedence.__getitem__,
+            )
 
             all_change_info.last_changed = max(
                 all_change_info.last_changed,
@@ -89,7 +94,7 @@ class Build(Dependency, Constructible, Artefactor, WrapperRun, Runnable):
         last_built = min(map(lambda x: x.last_built(), self._builders),
             default=min_datetime)
 
-        if (all_change_info.status is ChangeInfo.Status.CHANGED
+        if (all_change_info.status is _CHANGED
             or last_built < all_change_info.last_changed):
             for builder in self._builders:
                 builder.build()
@@ -122,6 +127,14 @@ class ChangeInfo(object):
         self.last_changed = last_changed
 
 
+_UNKNOWN = ChangeInfo.Status.UNKNOWN
+_UNCHANGED = ChangeInfo.Status.UNCHANGED
+_CHANGED = ChangeInfo.Status.CHANGED
+
+_status_precedence = {_UNCHANGED: 0, _UNKNOWN: 1, _CHANGED: 2}
+"""Precedence of statuses when merging ChangeInfos of several Sources."""
+
+
 class Source(object):
     def scan(self):
         """Perform a scan over the source set and return change info.
@@ -145,32 +158,253 @@ class Source(object):
 
 
 class Local(Source):
-    """docstring for Local"""
-    def __init__(self, path):
+    """docstring for Local
+
+    Args:
+        path (str): Path to the local directory containing the source files
+        use_cache (bool, optional): When True, a content digest of each file
+            is recorded in a persistent cache. Files whose mtime changed but
+            whose content is unchanged are then not regarded as changed.
+
+    Configuration Options:
+        * ``scan_workers``: Number of threads used to concurrently read
+            directories during ``scan()``, defaults to `default_scan_workers`
+        * ``cache_path``: Path to the file storing the persistent cache used
+            when `use_cache` is set, defaults to `default_cache_path`
+
+    """
+
+    default_scan_workers = 16
+    """See configuration option ``scan_workers``."""
+
+    default_cache_path = "~/bjec/cache/local_scan.pickle"
+    """See configuration option ``cache_path``."""
+
+    def __init__(self, path, use_cache=False):
         super(Local, self).__init__()
         self.path = path
+        self.use_cache = use_cache
         self._local_path = os.path.abspath(os.path.expanduser(path))
 
     def scan(self):
-        last_time = min_datetime
-
-        for root, dirs, files in os.walk(self._local_path, followlinks=True):
-            for file in files:
-                info = os.stat(os.path.join(self.path, root, file))
-                time = datetime.datetime.fromtimestamp(info.st_mtime,
-                    tz=datetime.timezone.utc)
-
-                if time > last_time:
-                    last_time = time
+        if self.use_cache:
+            cache_path = config[Local].get("cache_path",
+                self.default_cache_path)
+
+            with _ScanCache(cache_path) as cache:
+                last_mtime_ns, files = self._scan(
+                    cache.sources.get(self._local_path, {}))
+                cache.sources[self._local_path] = files
+        else:
+            last_mtime_ns, _ = self._scan(None)
 
-        if last_time == min_datetime:
+        if last_mtime_ns is None:
             last_time = max_datetime
+        else:
+            last_time = _datetime_from_ns(last_mtime_ns)
 
-        return ChangeInfo(ChangeInfo.Status.UNKNOWN, last_time)
+        return ChangeInfo(_UNKNOWN, last_time)
 
     def local_path(self):
         return self._local_path
 
+    def _scan(
+        self, cached: Optional[Dict[str, '_ScanCacheEntry']],
+    ) -> Tuple[Optional[int], Dict[str, '_ScanCacheEntry']]:
+        last_mtime_ns: Optional[int] = None
+        files: Dict[str, _ScanCacheEntry] = {}
+
+        max_workers = config[Local].get("scan_workers",
+            self.default_scan_workers)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+            pending = {pool.submit(_scan_dir, self._local_path, cached)}
+
+            while pending:
+                done, pending = concurrent.futures.wait(pending,
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+
+                for future in done:
+                    mtime_ns, dir_files, sub_dirs = future.result()
+
+                    if mtime_ns is not None and (last_mtime_ns is None
+                            or mtime_ns > last_mtime_ns):
+                        last_mtime_ns = mtime_ns
+
+                    files.update(dir_files)
+
+                    for sub_dir in sub_dirs:
+                        pending.add(pool.submit(_scan_dir, sub_dir, cached))
+
+        return last_mtime_ns, files
+
+
+def _scan_dir(
+    path: str, cached: Optional[Dict[str, '_ScanCacheEntry']] = None,
+) -> Tuple[Optional[int], Dict[str, '_ScanCacheEntry'], List[str]]:
+    """Scans a single directory, without descending into sub-directories.
+
+    Symbolic links are followed. As with ``os.walk()``, errors listing the
+    directory are ignored.
+
+    Args:
+        path (str): Path of the directory to scan.
+        cached (dict, optional): Maps file paths to ``_ScanCacheEntry``
+            objects of a previous scan. If given, the mtime of a file is only
+            regarded, if its content changed since the previous scan.
+
+    Returns:
+        tuple: The latest mtime (int, ns) of any file in the directory or None
+        if there are no files, a dict mapping the path of each file to its
+        ``_ScanCacheEntry`` (empty if `cached` is None) and a list of the
+        paths of all sub-directories.
+    """
+    last_mtime_ns: Optional[int] = None
+    files: Dict[str, _ScanCacheEntry] = {}
+    sub_dirs: List[str] = []
+
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return last_mtime_ns, files, sub_dirs
+
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=True):
+                sub_dirs.append(entry.path)
+                continue
+
+            info = entry.stat(follow_symlinks=True)
+
+            if cached is None:
+                mtime_ns = info.st_mtime_ns
+            else:
+                cache_entry = _ScanCache.updated_entry(
+                    entry.path, info, cached.get(entry.path))
+                files[entry.path] = cache_entry
+                mtime_ns = cache_entry.changed_mtime_ns
+
+            if last_mtime_ns is None or mtime_ns > last_mtime_ns:
+                last_mtime_ns = mtime_ns
+
+    return last_mtime_ns, files, sub_dirs
+
+
+_ScanCacheEntry = collections.namedtuple("_ScanCacheEntry",
+    ["mtime_ns", "size", "digest", "changed_mtime_ns"])
+
+
+class _ScanCache(object):
+    """Persistent record of the files seen by ``Local.scan()``.
+
+    The cache is a context manager. While open, an exclusive lock is held on
+    a sidecar lock file, so that concurrent bjec invocations do not corrupt
+    the cache. Changes to `sources` are written back when exiting without
+    an exception.
+
+    Attributes:
+        sources (dict): Maps the local path of each ``Local`` source to a dict
+            mapping the paths of its files to ``_ScanCacheEntry`` objects.
+    """
+
+    format_version = 2
+    """Version of the cache file's format, caches of other versions are
+    discarded."""
+
+    def __init__(self, path: str) -> None:
+        super(_ScanCache, self).__init__()
+        self.path: str = os.path.abspath(os.path.expanduser(path))
+        self.sources: Dict[str, Dict[str, _ScanCacheEntry]] = {}
+        self._lock_file: Optional[TextIO] = None
+
+    def __enter__(self) -> '_ScanCache':
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock_file = open(self.path + ".lock", "w")
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+
+        try:
+            with open(self.path, "rb") as f:
+                version, sources = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError,
+                TypeError, ValueError):
+            version, sources = None, {}
+
+        self.sources = sources if version == self.format_version else {}
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_val: Optional[BaseException] = None,
+        exc_tb: Optional[TracebackType] = None,
+    ) -> None:
+        lock_file = self._lock_file
+        if lock_file is None:
+            raise Exception('Wrong usage. _lock_file is not set but is expected to be.')
+
+        try:
+            if exc_type is None:
+                self._store()
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+            self._lock_file = None
+
+    def _store(self) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.path))
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((self.format_version, self.sources), f,
+                    pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def updated_entry(
+        path: str, info: os.stat_result, cached: Optional[_ScanCacheEntry],
+    ) -> _ScanCacheEntry:
+        """Returns the cache entry for the file at `path`.
+
+        The file's content is only hashed, if its mtime or size differ from
+        `cached`. If the content is unchanged, ``changed_mtime_ns`` is carried
+        over from `cached`.
+        """
+        if (cached is not None and cached.mtime_ns == info.st_mtime_ns
+                and cached.size == info.st_size):
+            return cached
+
+        digest = _file_digest(path)
+
+        if cached is not None and cached.digest == digest:
+            changed_mtime_ns = cached.changed_mtime_ns
+        else:
+            changed_mtime_ns = info.st_mtime_ns
+
+        return _ScanCacheEntry(info.st_mtime_ns, info.st_size, digest,
+            changed_mtime_ns)
+
+
+def _datetime_from_ns(ns: int) -> datetime.datetime:
+    """Returns the aware (UTC) datetime of a timestamp in nanoseconds."""
+    seconds, ns = divmod(ns, 1000000000)
+    return (datetime.datetime.fromtimestamp(seconds, tz=datetime.timezone.utc)
+        + datetime.timedelta(microseconds=ns // 1000))
+
+
+def _file_digest(path: str, chunk_size: int = 1024 * 1024) -> bytes:
+    h = hashlib.blake2b()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+
+    return h.digest()
+
 
 class GitRepo(Source):
     """docstring for GitRepo
@@ -211,9 +445,9 @@ class GitRepo(Source):
         unchanged = self._try_fetch()
 
         if unchanged:
-            status = ChangeInfo.Status.UNCHANGED
+            status = _UNCHANGED
         else:
-            status = ChangeInfo.Status.CHANGED
+            status = _CHANGED
 
         return ChangeInfo(
             status,
@@ -231,7 +465,7 @@ class GitRepo(Source):
         url_path = split_ext[0] if split_ext[1] == ".git" else url_path
 
         self._local_path = os.path.abspath(os.path.join(
-            os.path.expanduser(
+            _expanduser(
                 config[GitRepo].get("repos_path", self.default_repos_path)
             ),
             url.netloc,
@@ -248,8 +482,9 @@ class GitRepo(Source):
         """Ensures that the repository is properly set up.
 
         Ensures the local repository exists with the specified branch and that
-        tracking with the remote is configured. Performs the initial clone, if
-        necessary. May also fetch from the remote if the branch is changed.
+        tracking with the remote is configured. Performs the initial
+        (shallow) clone, if necessary. Always fetches the tip of the branch
+        from the remote.
 
         Returns:
             bool: If any changes were made, False is returned, otherwise True.
@@ -270,8 +505,9 @@ class GitRepo(Source):
 
         assert remote.exists()
 
+        self._fetch_branch(remote)
+
         if self.branch not in self.repo.heads:
-            remote.fetch()
             assert self.branch in remote.refs
             local_branch = self.repo.create_head(
                 self.branch,
@@ -287,19 +523,29 @@ class GitRepo(Source):
 
         return unchanged
 
+    def _fetch_branch(self, remote: git.Remote) -> None:
+        """Fetches only the tip commit of the branch from `remote`."""
+        remote.repo.git.fetch(
+            "--depth=1",
+            remote.name,
+            f"+refs/heads/{self.branch}:refs/remotes/{remote.name}/{self.branch}",
+        )
+
     def _try_fetch(self):
         self._create_repo_structure()
 
         unchanged = self._ensure_repo()
 
-        fetch_info = self.repo.remote().fetch()
+        local_branch = self.repo.heads[self.branch]
+        remote_commit = self.repo.remote().refs[self.branch].commit
 
-        if fetch_info[0].commit != self.repo.heads[self.branch].commit:
-            self.repo.remote().pull()
+        if remote_commit != local_branch.commit:
+            local_branch.checkout()
+            local_branch.repo.git.reset("--hard", remote_commit.hexsha)
             unchanged = False
 
         if not unchanged:
-            self.repo.heads[self.branch].checkout()
+            local_branch.checkout()
 
         return unchanged
 
@@ -348,31 +594,17 @@ class Make(Builder):
         self.clean_target = clean_target
 
         self._has_run = False
+        self._env: Optional[Dict[str, str]] = None
+        self._env_merged: bool = False
 
     def build(self):
         if self.clean_first:
             self.clean()
 
-        args = ["make"]
-
-        env = config[Make].get("environment")
-        if env is not None:
-            t = dict(os.environ)
-            t.update(env)
-            env = t
-
         if self.target is not None:
-            args += listify(self.target)
-
-        subprocess.run(
-            args,
-            cwd=self.path,
-            env=env,
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.STDOUT,
-            check=True,
-        )
+            self._make(listify(self.target))
+        else:
+            self._make([])
 
         self._has_run = True
 
@@ -388,23 +620,38 @@ class Make(Builder):
         if self.creates is None:
             return min_datetime
 
-        first_time = max_datetime
+        by_dir = collections.defaultdict(set)
 
         for f_p in listify(self.creates):
+            dir_path, name = os.path.split(
+                os.path.normpath(os.path.join(self.path, f_p)))
+            by_dir[dir_path].add(name)
+
+        first_mtime_ns = None
+
+        for dir_path, names in by_dir.items():
             try:
-                info = os.stat(os.path.join(self.path, f_p))
-                time = datetime.datetime.fromtimestamp(info.st_mtime,
-                    tz=datetime.timezone.utc)
+                it = os.scandir(dir_path if dir_path != "" else ".")
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+
+            with it:
+                for entry in it:
+                    if entry.name not in names:
+                        continue
+
+                    try:
+                        mtime_ns = entry.stat().st_mtime_ns
+                    except FileNotFoundError:
+                        continue
 
-                if time < first_time:
-                    first_time = time
-            except FileNotFoundError:
-                pass
+                    if first_mtime_ns is None or mtime_ns < first_mtime_ns:
+                        first_mtime_ns = mtime_ns
 
-        if first_time == max_datetime:
+        if first_mtime_ns is None:
             return min_datetime
 
-        return first_time
+        return _datetime_from_ns(first_mtime_ns)
 
     def clean(self):
         if self.clean_target is None:
@@ -412,24 +659,48 @@ class Make(Builder):
                 "Can't perform clean: No 'clean_target' parameter given"
             )
 
-        args = ["make"] + listify(self.clean_target)
+        self._make(listify(self.clean_target))
 
-        env = config[Make].get("environment")
-        if env is not None:
-            t = dict(os.environ)
-            t.update(env)
-            env = t
+    def _make(self, targets: List[str]) -> None:
+        """Runs make with `targets` in `path`.
+
+        The directory is passed via ``-C`` and make is resolved to an absolute
+        path, which (along with ``close_fds=False``) allows ``subprocess`` to
+        spawn the process with ``posix_spawn()`` instead of ``fork()``.
+        """
+        env = self._environment()
+        # Resolve make on the PATH make is run with, which may be set via
+        # the ``environment`` configuration option.
+        search_path = env.get("PATH") if env is not None else None
+        make = shutil.which("make", path=search_path) or "make"
 
         subprocess.run(
-            args,
-            cwd=self.path,
+            [make, "-C", self.path] + targets,
             env=env,
             stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.STDOUT,
+            close_fds=False,
             check=True,
         )
 
+    def _environment(self) -> Optional[Dict[str, str]]:
+        """Returns the environment passed to make, merged once and reused.
+
+        Returns:
+            dict or None: ``os.environ`` updated with the ``environment``
+            configuration option or None if the option is not set.
+        """
+        if not self._env_merged:
+            env: Optional[Dict[str, str]] = config[Make].get("environment")
+            if env is not None:
+                env = {**os.environ, **env}
+
+            self._env = env
+            self._env_merged = True
+
+        return self._env
+
     def result(self):
         # Make might not have been called, because there have been no changes
         # the files' source.
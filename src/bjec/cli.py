@@ -1,9 +1,18 @@
 import argparse
+import functools
+import hashlib
+import importlib.util
+import marshal
+import os
+import os.path
 import runpy
 import sys
-from typing import Any, cast, Optional
+from types import CodeType, ModuleType
+from typing import Any, cast, Dict, Optional
+import zipfile
 
 from .config import config as config_obj
+from .master import master
 
 
 class RunArgs:
@@ -12,27 +21,137 @@ class RunArgs:
 	name: str
 
 
+def _cache_dir() -> str:
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if not cache_home:
+        cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'bjec', 'compiled')
+
+
+def _compile_cached(path: str, cache_dir: Optional[str] = None) -> CodeType:
+    """Compiles the Python file at ``path``, caching the code object on disk.
+
+    The cache file is named after ``path`` and holds the marshalled code
+    object behind a header of the interpreter's magic number, the
+    ``st_mtime_ns`` and the ``st_size`` of the source. It is only used if
+    all three match. Failures to write the cache are ignored.
+    """
+
+    if cache_dir is None:
+        cache_dir = _cache_dir()
+
+    st = os.stat(path)
+    header = (
+        importlib.util.MAGIC_NUMBER
+        + st.st_mtime_ns.to_bytes(8, 'little')
+        + st.st_size.to_bytes(8, 'little')
+    )
+    cache_path = os.path.join(
+        cache_dir,
+        hashlib.sha256(os.fsencode(path)).hexdigest() + '.pyc',
+    )
+
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        pass
+    else:
+        if data[:len(header)] == header:
+            try:
+                return cast(CodeType, marshal.loads(data[len(header):]))
+            except (EOFError, ValueError, TypeError):
+                pass
+
+    with open(path, 'rb') as f:
+        code = compile(f.read(), path, 'exec', dont_inherit=True)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(header + marshal.dumps(code))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return code
+
+
+def _run_path(path: str, cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Executes the Python file at ``path`` and returns its globals.
+
+    Behaves like ``runpy.run_path()`` for plain source files, but the
+    compiled code is cached by :func:`_compile_cached`. Directories and zip
+    files containing a ``__main__.py`` are passed to ``runpy.run_path()``.
+    """
+
+    if os.path.isdir(path) or zipfile.is_zipfile(path):
+        return runpy.run_path(path)
+
+    path = os.path.abspath(path)
+    code = _compile_cached(path, cache_dir)
+
+    mod_name = '<run_path>'
+    module = ModuleType(mod_name)
+    module.__file__ = path
+    module.__package__ = ''
+
+    saved_module = sys.modules.get(mod_name)
+    saved_argv0 = sys.argv[0] if sys.argv else None
+    sys.modules[mod_name] = module
+    if sys.argv:
+        sys.argv[0] = path
+    try:
+        exec(code, module.__dict__)
+    finally:
+        if saved_module is not None:
+            sys.modules[mod_name] = saved_module
+        else:
+            del sys.modules[mod_name]
+        if saved_argv0 is not None:
+            sys.argv[0] = saved_argv0
+
+    return module.__dict__.copy()
+
+
 def run(args: RunArgs) -> None:
     if args.config_path is not None:
         config_obj.read_yaml(args.config_path)
 
-    bjec_file_globals = runpy.run_path(args.file)
+    bjec_file_globals = _run_path(args.file)
+
+    # Fail before running anything if the definition file declares cyclic
+    # dependencies.
+    master.check_cycles()
 
     bjec_file_globals[args.name]()
 
-parser = argparse.ArgumentParser(description='batch job executor and collector.')
-if sys.version_info >= (3, 7): # VERSION_RULE: Python 3.6
-	subparsers = parser.add_subparsers(dest='command', required=True)
-else:
-	subparsers = parser.add_subparsers(dest='command')
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(description='batch job executor and collector.')
+	if sys.version_info >= (3, 7): # VERSION_RULE: Python 3.6
+		subparsers = parser.add_subparsers(dest='command', required=True)
+	else:
+		subparsers = parser.add_subparsers(dest='command')
+
+	parser_record = subparsers.add_parser(
+		'run', help='executes a runnable from a bjec definition file.',
+	)
+	parser_record.add_argument(
+		'-f', '--file', default='bjec.py', type=str,
+		help='bjec definition file, a directory or zip file with a __main__.py is also accepted. '
+			'Defaults to "bjec.py" in the working directory.',
+	)
+	parser_record.add_argument(
+		'-c', '--config', type=str, dest='config_path', help='config file in YAML format.',
+	)
+	parser_record.add_argument('name', type=str, help='name of the runnable to execute.')
 
-parser_record = subparsers.add_parser('run', help='executes a runnable from a bjec definition file.')
-parser_record.add_argument('-f', '--file', default='bjec.py', type=str, help='bjec definition file. Defaults to "bjec.py" in the working directory.')
-parser_record.add_argument('-c', '--config', type=str, dest='config_path', help='config file in YAML format.')
-parser_record.add_argument('name', type=str, help='name of the runnable to execute.')
+	return parser
 
 def main() -> None:
-	args = parser.parse_args(sys.argv[1:])
+	args = _build_parser().parse_args(sys.argv[1:])
 
 	if args.command == 'run':
 		run(cast(RunArgs, args))
@@ -1,13 +1,30 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from contextlib import ExitStack
-from shutil import copyfileobj
+import itertools
+import locale
+import operator
 import os
+from queue import SimpleQueue
 from tempfile import mkstemp
+from threading import Thread
 from types import TracebackType
-from typing import Any, BinaryIO, Callable, cast, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+from typing import Any, BinaryIO, Callable, cast, Dict, Generic, Iterable, List, Optional, Sized, Tuple, Type, TypeVar, TYPE_CHECKING, Union
 
+from .config import config
 from .params import ParamSet, Resolvable, resolve
-from .io import ensure_writeable, PathType, PrimitivePathType, ReadOpenable, resolve_writable, Writeable, WriteOpenableWrapBinaryIO
+from .io import (
+    _drop_cache,
+    _read_path,
+    AGGREGATE_BUFFER_SIZE,
+    copy_file,
+    PathType,
+    PrimitivePathType,
+    ReadOpenable,
+    Writeable,
+    WriteOpenable,
+    WriteOpenableWrapBinaryIO,
+)
 from .utils import consume, listify
 
 _T = TypeVar('_T')
@@ -64,22 +81,65 @@ class Collector(Generic[_T_contra], ABC):
 
 class Noop(Collector[_T_contra], Generic[_T_contra]):
     def collect(self, results: Iterable[Tuple[ParamSet, _T_contra]]) -> None:
+        # Iterators must be exhausted, as producing the results may have side
+        # effects. Sized containers hold results which are already produced.
+        if isinstance(results, Sized):
+            return
+
         consume(results)
 
 
 class Multi(Collector[_T_contra], Generic[_T_contra]):
-    def __init__(self, *collectors: Collector[_T_contra]) -> None:
+    """Multi passes all results to each of several collectors.
+
+    Results are passed on in batches: Each collector's ``collect()`` is
+    called once per batch rather than once per result, while collection
+    still progresses as results become available.
+
+    Args:
+        *collectors: Collectors to pass all results to.
+        batch_size: Maximum number of results passed to the collectors at
+            once.
+        parallel: If ``True``, each batch is passed to the collectors
+            concurrently, using one thread per additional collector. This
+            overlaps the I/O of collectors writing to independent files.
+            ``collect()`` still only returns once all collectors have
+            processed all results.
+    """
+
+    def __init__(
+        self,
+        *collectors: Collector[_T_contra],
+        batch_size: int = 64,
+        parallel: bool = False,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError('batch_size must be positive')
+
         self._collectors: Tuple[Collector[_T_contra], ...] = collectors
+        self._batch_size: int = batch_size
+        self._parallel: bool = parallel
         self._stack: ExitStack = ExitStack()
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     @property
     def collectors(self) -> Tuple[Collector[_T_contra], ...]:
         return self._collectors
 
     def __enter__(self) -> 'Multi[_T_contra]':
-        self._stack.__enter__()
-        for collector in self._collectors:
-            self._stack.enter_context(collector)
+        # Collectors already entered are exited if entering another fails.
+        with ExitStack() as stack:
+            enter_context = stack.enter_context
+            for collector in self._collectors:
+                enter_context(collector)
+            if self._parallel and len(self._collectors) > 1:
+                # Exited first, i.e. all threads are done before the
+                # collectors are exited.
+                self._pool = enter_context(
+                    ThreadPoolExecutor(max_workers=len(self._collectors) - 1),
+                )
+            self._stack = stack.pop_all()
+
         return self
 
     def __exit__(
@@ -88,12 +148,46 @@ class Multi(Collector[_T_contra], Generic[_T_contra]):
         exc_val: Optional[BaseException] = None,
         exc_tb: Optional[TracebackType] = None,
     ) -> Optional[bool]:
+        self._pool = None
         return self._stack.__exit__(exc_type, exc_val, exc_tb)
 
     def collect(self, results: Iterable[Tuple[ParamSet, _T_contra]]) -> None:
-        for params, result in results:
-            for collector in self._collectors:
-                collector.collect(((params, result),))
+        it = iter(results)
+
+        while True:
+            batch = tuple(itertools.islice(it, self._batch_size))
+            if len(batch) == 0:
+                return
+
+            if self._pool is None:
+                for collector in self._collectors:
+                    collector.collect(batch)
+            else:
+                self._collect_parallel(self._pool, batch)
+
+    def _collect_parallel(
+        self,
+        pool: ThreadPoolExecutor,
+        batch: Tuple[Tuple[ParamSet, _T_contra], ...],
+    ) -> None:
+        first, *others = self._collectors
+
+        futures: List['Future[None]'] = [
+            pool.submit(collector.collect, batch) for collector in others
+        ]
+        try:
+            first.collect(batch)
+        finally:
+            wait(futures)
+
+        for future in futures:
+            future.result()
+
+
+if TYPE_CHECKING:
+    _DemuxQueue = SimpleQueue[Optional[Tuple[Collector[Any], ParamSet, Any]]]
+else:
+    _DemuxQueue = SimpleQueue
 
 
 class Demux(Collector[_T_contra], Generic[_T_contra]):
@@ -106,26 +200,52 @@ class Demux(Collector[_T_contra], Generic[_T_contra]):
         factory: Function to call to create a new collector. A reduced
             parameter set is passed as the only argument, containing only
             those parameters specified in ``keys``.
+        workers: Number of threads passing results to the collectors. If
+            ``0``, results are passed on in the calling thread. Otherwise,
+            each collector is served by one of the threads, so that
+            collectors, e.g. writing to different files, work concurrently.
+            Results may then still be processed after ``collect()`` returns,
+            but all are processed before the context manager exits. Each
+            collector still receives its results in order.
     """
 
     def __init__(
         self,
         keys: Iterable[str],
         factory: 'Callable[[ParamSet], Collector[_T_contra]]',
+        workers: int = 0,
     ):
         super(Demux, self).__init__()
+        if workers < 0:
+            raise ValueError('workers must not be negative')
+
         self._keys: Tuple[str, ...] = tuple(keys)
+        self._key_getter: Callable[[ParamSet], Tuple[Any, ...]] = _tuple_getter(self._keys)
         self._factory: Callable[[ParamSet], Collector[_T_contra]] = factory
+        self._workers: int = workers
 
         self._stack: ExitStack = ExitStack()
         self._collectors: Dict[Tuple[Any, ...], Collector[_T_contra]] = {}
 
+        self._queues: List[_DemuxQueue] = []
+        self._collector_queues: Dict[Tuple[Any, ...], _DemuxQueue] = {}
+        self._threads: List[Thread] = []
+        self._error: Optional[BaseException] = None
+
     @property
     def keys(self) -> Tuple[str, ...]:
         return self._keys
 
     def __enter__(self) -> 'Demux[_T_contra]':
         self._stack.__enter__()
+
+        for _ in range(self._workers):
+            q: _DemuxQueue = SimpleQueue()
+            thread = Thread(target=self._drain, args=(q,), daemon=True)
+            thread.start()
+            self._queues.append(q)
+            self._threads.append(thread)
+
         return self
 
     def __exit__(
@@ -134,7 +254,22 @@ class Demux(Collector[_T_contra], Generic[_T_contra]):
         exc_val: Optional[BaseException] = None,
         exc_tb: Optional[TracebackType] = None,
     ) -> Optional[bool]:
-        return self._stack.__exit__(exc_type, exc_val, exc_tb)
+        for q in self._queues:
+            q.put(None)
+        for thread in self._threads:
+            thread.join()
+
+        self._queues.clear()
+        self._collector_queues.clear()
+        self._threads.clear()
+
+        ret = self._stack.__exit__(exc_type, exc_val, exc_tb)
+
+        error, self._error = self._error, None
+        if error is not None and exc_type is None:
+            raise error
+
+        return ret
 
     def collect(self, results: Iterable[Tuple[ParamSet, _T_contra]]) -> None:
         for params, result in results:
@@ -150,16 +285,61 @@ class Demux(Collector[_T_contra], Generic[_T_contra]):
         """
         typed_result = cast(_T_contra, result)
 
-        t = tuple(params[key] for key in self._keys)
+        t = self._key_getter(params)
 
-        try:
-            collector = self._collectors[t]
-        except KeyError:
-            collector = self._factory({key: params[key] for key in self._keys})
+        collector = self._collectors.get(t)
+        if collector is None:
+            collector = self._factory(dict(zip(self._keys, t)))
             self._collectors[t] = collector
             self._stack.enter_context(collector)
+            if self._queues:
+                # Collectors are assigned to the workers round-robin.
+                self._collector_queues[t] = self._queues[(len(self._collectors) - 1) % len(self._queues)]
+
+        if not self._queues:
+            collector.collect(((params, typed_result),))
+            return
+
+        if self._error is not None:
+            raise self._error
+
+        self._collector_queues[t].put((collector, params, typed_result))
+
+    def _drain(
+        self,
+        q: _DemuxQueue,
+    ) -> None:
+        while True:
+            item = q.get()
+            if item is None:
+                return
+
+            if self._error is not None:
+                # Results are discarded after the first failure.
+                continue
+
+            collector, params, result = item
+            try:
+                collector.collect(((params, result),))
+            except BaseException as e:
+                self._error = e
+
+
+def _tuple_getter(keys: Tuple[str, ...]) -> Callable[[ParamSet], Tuple[Any, ...]]:
+    """Returns a function retrieving the values of ``keys`` as a tuple.
+
+    :func:`operator.itemgetter` is used where possible, it only returns a
+    tuple for more than one key though.
+    """
+
+    if len(keys) == 0:
+        return lambda params: ()
 
-        collector.collect(((params, typed_result),))
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda params: (params[key],)
+
+    return cast('Callable[[ParamSet], Tuple[Any, ...]]', operator.itemgetter(*keys))
 
 
 class Convert(Collector[_T_contra], Generic[_T_contra, _S]):
@@ -184,7 +364,8 @@ class Convert(Collector[_T_contra], Generic[_T_contra, _S]):
         return self._collector.__exit__(exc_type, exc_val, exc_tb)
 
     def collect(self, results: Iterable[Tuple[ParamSet, _T_contra]]) -> None:
-        self._collector.collect(map(lambda r: (r[0], self._f(r[1])), results))
+        f = self._f
+        self._collector.collect((params, f(result)) for params, result in results)
 
 
 class Concatenate(Collector[ReadOpenable]):
@@ -193,6 +374,20 @@ class Concatenate(Collector[ReadOpenable]):
     Args:
         path: The file path to be opened as the aggregate file. If ``None`` a
             temporary file is created (which is not deleted).
+        buffer_size: Size of the write buffer of the aggregate file and of
+            the buffer used to copy results, in bytes. If ``None``, the
+            configuration option of the same name is used.
+        drop_cache: Advise the kernel to drop the cached pages of each result
+            file once it is copied and of the aggregate file once it is
+            written back. This avoids filling the page cache with data which
+            is read only once when concatenating large results. When exiting,
+            the aggregate file is synchronised to disk.
+
+    Configuration Options:
+
+        * ``buffer_size``: Size of the write buffer of the aggregate file in
+            bytes. The option is used when no ``buffer_size`` is passed to the
+            constructor. Defaults to 1 MiB.
     """
 
     def __init__(
@@ -202,13 +397,23 @@ class Concatenate(Collector[ReadOpenable]):
         after_all: Optional[Union[Writeable, str, bytes]] = None,
         before: Optional[Resolvable[Union[Writeable, str, bytes]]] = None,
         after: Optional[Resolvable[Union[Writeable, str, bytes]]] = None,
+        buffer_size: Optional[int] = None,
+        drop_cache: bool = False,
     ):
         super(Concatenate, self).__init__()
 
+        self._buffer_size: Optional[int] = buffer_size
+        self._copy_chunk_size: int = AGGREGATE_BUFFER_SIZE
+        self._drop_cache: bool = drop_cache
+
         self._before_all: Optional[Union[Writeable, str, bytes]] = before_all
         self._after_all: Optional[Union[Writeable, str, bytes]] = after_all
         self._before: Optional[Resolvable[Union[Writeable, str, bytes]]] = before
         self._after: Optional[Resolvable[Union[Writeable, str, bytes]]] = after
+        self._write_before_all: Optional[_SegmentWriter] = _segment_writer(before_all)
+        self._write_after_all: Optional[_SegmentWriter] = _segment_writer(after_all)
+        self._write_before: Optional[_SegmentWriter] = _segment_writer(before)
+        self._write_after: Optional[_SegmentWriter] = _segment_writer(after)
 
         self._aggregate_path: PrimitivePathType
         if path is not None:
@@ -216,7 +421,10 @@ class Concatenate(Collector[ReadOpenable]):
         else:
             fd, self._aggregate_path = mkstemp()
             os.close(fd)
+        # Encoded once, rather than by open() on every __enter__().
+        self._aggregate_open_path: bytes = os.fsencode(self._aggregate_path)
         self._aggregate_file: Optional[BinaryIO] = None
+        self._aggregate_openable: Optional[WriteOpenableWrapBinaryIO] = None
 
     @property
     def path(self) -> Union[str, bytes]:
@@ -226,39 +434,128 @@ class Concatenate(Collector[ReadOpenable]):
         if self._aggregate_file is not None:
             raise Exception('Wrong usage. _aggregate_file is set but is expected to not be.')
 
-        self._aggregate_file = open(self._aggregate_path, 'wb')
+        self._copy_chunk_size = (
+            self._buffer_size if self._buffer_size is not None
+            else config[Concatenate].get('buffer_size', AGGREGATE_BUFFER_SIZE)
+        )
+        self._aggregate_file = open(
+            self._aggregate_open_path,
+            'wb',
+            buffering = self._copy_chunk_size,
+        )
+        self._aggregate_openable = WriteOpenableWrapBinaryIO(self._aggregate_file)
 
-        if self._before_all is not None:
-            openable = WriteOpenableWrapBinaryIO(self._aggregate_file)
-            ensure_writeable(self._before_all).write_to(openable)
+        if self._write_before_all is not None:
+            self._write_before_all(self._aggregate_file, self._aggregate_openable, {})
 
         return self
 
     def __exit__(self, *args: Any) -> Optional[bool]:
-        if self._aggregate_file is None:
+        if self._aggregate_file is None or self._aggregate_openable is None:
             raise Exception('Wrong usage. _aggregate_file is not set but is expected to be.')
 
-        if self._after_all is not None:
-            openable = WriteOpenableWrapBinaryIO(self._aggregate_file)
-            ensure_writeable(self._after_all).write_to(openable)
+        if self._write_after_all is not None:
+            self._write_after_all(self._aggregate_file, self._aggregate_openable, {})
+
+        if self._drop_cache:
+            self._aggregate_file.flush()
+            getattr(os, 'fdatasync', os.fsync)(self._aggregate_file.fileno())
+            _drop_cache(self._aggregate_file.fileno())
 
         self._aggregate_file.close()
         self._aggregate_file = None
+        self._aggregate_openable = None
 
         return None
 
     def collect(self, results: Iterable[Tuple[ParamSet, ReadOpenable]]) -> None:
-        if self._aggregate_file is None:
+        if self._aggregate_file is None or self._aggregate_openable is None:
             raise Exception('Wrong usage. _aggregate_file is not set but is expected to be.')
 
+        aggregate_file = self._aggregate_file
+        aggregate_openable = self._aggregate_openable
+        write_before = self._write_before
+        write_after = self._write_after
+        drop_cache = self._drop_cache
+        chunk_size = self._copy_chunk_size
+
         for params, result in results:
-            if self._before is not None:
-                openable = WriteOpenableWrapBinaryIO(self._aggregate_file)
-                resolve_writable(self._before, params).write_to(openable)
+            if write_before is not None:
+                write_before(aggregate_file, aggregate_openable, params)
+
+            path = _read_path(result)
+            if path is not None:
+                # copy_file() operates on the descriptor, a read buffer would
+                # only be allocated and discarded for every result.
+                with open(path, 'rb', buffering=0) as raw_file:
+                    copy_file(raw_file, aggregate_file, chunk_size)
+                    if drop_cache:
+                        _drop_cache(raw_file.fileno())
+            else:
+                with result.open_bytes() as result_file:
+                    copy_file(result_file, aggregate_file, chunk_size)
+                    if drop_cache:
+                        try:
+                            _drop_cache(result_file.fileno())
+                        except OSError:
+                            pass
+
+            if drop_cache:
+                _drop_cache(aggregate_file.fileno())
+
+            if write_after is not None:
+                write_after(aggregate_file, aggregate_openable, params)
+
+
+_SegmentWriter = Callable[[BinaryIO, WriteOpenable, ParamSet], None]
+
+def _segment_writer(
+    source: Optional[Resolvable[Union[Writeable, str, bytes]]],
+) -> Optional[_SegmentWriter]:
+    """Returns a function writing ``source`` for a result to a binary file.
+
+    The function is passed the file ``f``, a :obj:`WriteOpenable` wrapping
+    ``f`` and the parameter set. :obj:`Writeable` sources are written to the
+    wrapper, so that it is only created once per file.
+
+    The function is specialised on the type of ``source``: Constant ``str``
+    and ``bytes`` are encoded once and written directly, skipping parameter
+    resolution and the :obj:`Writeable` machinery. Resolved ``str`` and
+    ``bytes`` values are written directly as well, which avoids flushing
+    ``f`` and wrapping it for every result. ``None`` is returned if
+    ``source`` is ``None``.
+    """
+
+    if source is None:
+        return None
+
+    # Same encoding and newline translation as WriteableFromStr applies
+    # through a default TextIOWrapper.
+    encoding = locale.getpreferredencoding(False)
 
-            with result.open_bytes() as result_file:
-                copyfileobj(result_file, self._aggregate_file)
+    def encode(s: str) -> bytes:
+        if os.linesep != '\n':
+            s = s.replace('\n', os.linesep)
+        return s.encode(encoding)
+
+    if isinstance(source, (str, bytes)):
+        content = source if isinstance(source, bytes) else encode(source)
+
+        def write_bytes(f: BinaryIO, openable: WriteOpenable, params: ParamSet) -> None:
+            f.write(content)
+
+        return write_bytes
+
+    resolvable: Resolvable[Union[Writeable, str, bytes]] = source
+
+    def write_resolved(f: BinaryIO, openable: WriteOpenable, params: ParamSet) -> None:
+        resolved = cast('Union[Writeable, str, bytes]', resolve(resolvable, params))
+
+        if isinstance(resolved, (bytes, bytearray)):
+            f.write(resolved)
+        elif isinstance(resolved, str):
+            f.write(encode(resolved))
+        else:
+            resolved.write_to(openable)
 
-            if self._after is not None:
-                openable = WriteOpenableWrapBinaryIO(self._aggregate_file)
-                resolve_writable(self._after, params).write_to(openable)
+    return write_resolved
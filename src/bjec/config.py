@@ -3,48 +3,76 @@ import yaml
 
 from .io import PathType
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader # type: ignore[assignment]
+
+
+_MISSING = object()
+_NOT_A_DICT = object()
+
 
 class ModuleConfig(object):
     def __init__(self, config: 'Config', key_parts: Iterable[str]) -> None:
         super(ModuleConfig, self).__init__()
         self._config: Config = config
         self._key_parts: Tuple[str, ...] = tuple(key_parts)
+        self._node: Any = _MISSING
+        self._node_version: int = -1
 
     @property
     def key_parts(self) -> Tuple[str, ...]:
         return self._key_parts
 
-    def __contains__(self, key: str) -> bool:
-        config_elm: Union[Dict[str, Any], Any] = self._config._config_dict
-        try:
+    def _module_node(self) -> Any:
+        """Returns the config element of this module.
+
+        ``_MISSING`` is returned if the element does not exist and
+        ``_NOT_A_DICT`` if the path to it contains an element which is not a
+        dict. The result is cached until the config is modified.
+        """
+        if self._node_version != self._config._version:
+            node: Any = self._config._config_dict
             for key_part in self._key_parts:
-                config_elm = config_elm[key_part]
-            return key in config_elm
-        except KeyError:
-            return False
-        except TypeError:
-            return False
+                if not isinstance(node, dict):
+                    node = _NOT_A_DICT
+                    break
+
+                node = node.get(key_part, _MISSING)
+                if node is _MISSING:
+                    break
+
+            self._node = node
+            self._node_version = self._config._version
+
+        return self._node
+
+    def __contains__(self, key: str) -> bool:
+        node = self._module_node()
+        return isinstance(node, dict) and key in node
 
     def __getitem__(self, key: str) -> Any:
-        config_elm: Union[Dict[str, Any], Any] = self._config._config_dict
-        key_parts = self._key_parts + (key,)
-        try:
-            for key_part in key_parts:
-                config_elm = config_elm[key_part]
-        except KeyError:
-            key_str = '.'.join(key_parts)
+        node = self._module_node()
+
+        if isinstance(node, dict):
+            value = node.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        key_str = '.'.join(self._key_parts + (key,))
+        if node is _MISSING or isinstance(node, dict):
             raise KeyError(f'{key!r} in {key_str} not in config')
-        except TypeError as e:
-            key_str = '.'.join(key_parts)
+        else:
             raise KeyError(f'{key!r} in {key_str} does not resolve to a dict')
 
-        return config_elm
-
     def get(self, key: str, default: Optional[Union[Any]]=None) -> Optional[Any]:
-        try:
-            return self[key]
-        except KeyError:
-            return default
+        node = self._module_node()
+
+        if isinstance(node, dict):
+            return node.get(key, default)
+
+        return default
 
 
 class Config(object):
@@ -52,7 +80,10 @@ class Config(object):
         super(Config, self).__init__()
         self._namespace: str = namespace
         self._config_dict: Dict[str, Any] = {}
+        # Incremented on every modification of _config_dict.
+        self._version: int = 0
         self._user_module: ModuleConfig = ModuleConfig(self, ['user'])
+        self._module_configs: Dict[Union[str, Type[object]], ModuleConfig] = {}
 
     @property
     def namespace(self) -> str:
@@ -66,18 +97,31 @@ class Config(object):
         return self._resolve_key(key) in self._config_dict
 
     def __getitem__(self, key: Union[str, object, Type[object]]) -> Any:
-        key_parts = self._resolve_key(key).split('.')
+        # Instances resolve to the same key as their class.
+        cache_key = key if isinstance(key, (str, type)) else type(key)
+
+        module_config = self._module_configs.get(cache_key)
+        if module_config is not None:
+            return module_config
+
+        key_parts = self._resolve_key(cache_key).split('.')
 
         if key_parts[0] == self._namespace:
             key_parts = key_parts[1:]
 
-        return ModuleConfig(self, key_parts)
+        module_config = ModuleConfig(self, key_parts)
+        self._module_configs[cache_key] = module_config
+
+        return module_config
 
     def read_yaml(self, path: PathType) -> None:
-        with open(path) as f:
-            config = yaml.safe_load(f)
+        # The loader detects the encoding (UTF-8 or UTF-16) of the stream
+        # itself, libyaml then reads the bytes without a decoding wrapper.
+        with open(path, 'rb') as f:
+            config = yaml.load(f, Loader=_YAMLLoader)
 
         self._config_dict.update(config)
+        self._version += 1
 
     def _resolve_key(self, key: Union[str, object, Type[object]]) -> str:
         if isinstance(key, str):
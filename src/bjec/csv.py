@@ -1,13 +1,16 @@
+import codecs
 import csv
-from io import TextIOWrapper
+from io import BytesIO, StringIO, TextIOWrapper
 import itertools
+import locale
 import os
 from tempfile import mkstemp
-from typing import Any, BinaryIO, cast, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple, Union
+from typing import Any, BinaryIO, Callable, cast, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple, Union
 from typing_extensions import Protocol
 
 from .collector import Collector as CollectorABC
-from .io import ReadOpenable, PathType, PrimitivePathType, WriteOpenableWrapBinaryIO
+from .config import config
+from .io import _read_ahead, AGGREGATE_BUFFER_SIZE, ReadOpenable, PathType, PrimitivePathType, WriteOpenableWrapBinaryIO
 from .params import ensure_multi_iterable, IterableResolvable, ParamsEvaluable, ParamSet, Resolvable, resolve_iterable
 
 _Row = Iterable[Any]
@@ -15,23 +18,33 @@ _Rows = Iterable[Iterable[Any]]
 _RowResolvable = IterableResolvable[Any]
 _RowsResolvable = Union[ParamsEvaluable[_Rows], Iterable[IterableResolvable[Any]]]
 
-def _resolve_rows(rows: _RowsResolvable, params: ParamSet) -> _Rows:
-    try:
-        return cast('ParamsEvaluable[_Rows]', rows).evaluate_with_params(params)
-    except (AttributeError, TypeError):
-        return (resolve_iterable(row, params) for row in cast('Iterable[IterableResolvable[Any]]', rows))
+def _rows_resolver(rows: _RowsResolvable) -> Callable[[ParamSet], _Rows]:
+    """Returns a function resolving ``rows`` for a parameter set.
+
+    ``rows`` must have been prepared by :func:`_prepare_rows_resolvable`.
+    The kind of ``rows`` is determined once, instead of on every call.
+    """
+
+    if isinstance(rows, ParamsEvaluable):
+        return rows.evaluate_with_params
+
+    row_list = cast('List[IterableResolvable[Any]]', rows)
+    if len(row_list) == 0:
+        return lambda params: ()
+
+    return lambda params: (resolve_iterable(row, params) for row in row_list)
 
 def _prepare_rows(rows: Optional[_Rows]) -> _Rows:
     if rows is None:
-        return []
+        return ()
 
-    return [list(row) for row in rows]
+    return tuple(tuple(row) for row in rows)
 
 def _prepare_row(row: Optional[_Row]) -> _Row:
     if row is None:
-        return []
+        return ()
 
-    return list(row)
+    return tuple(row)
 
 def _prepare_rows_resolvable(rows: Optional[_RowsResolvable]) -> _RowsResolvable:
     if rows is None:
@@ -51,8 +64,12 @@ def _prepare_row_resolvable(row: Optional[_RowResolvable]) -> _RowResolvable:
 
 _CSVReader = Iterator[List[str]]
 
+_VERBATIM_CHUNK_SIZE = 64 * 1024
+
 
 class _CSVWriter(Protocol):
+    @property
+    def dialect(self) -> Any: ...
     def writerow(self, row: Iterable[Any]) -> Any: ...
     def writerows(self, rows: Iterable[Iterable[Any]]) -> None: ...
 
@@ -110,6 +127,33 @@ class Collector(CollectorABC[ReadOpenable]):
             as-is to the :obj:`TextIOWrapper` constructor.
         output_csv_args: Args passed to :func:`csv.writer` when constructing
             the writer for output file. This may include the ``dialect`` key.
+        buffer_size: Size of the write buffer of the aggregate file in bytes.
+            If ``None``, the configuration option of the same name is used.
+        copy_verbatim: If ``True``, the data rows of input files are copied
+            byte by byte instead of being parsed and written by the CSV
+            writer. This is considerably faster, but rows are not normalised,
+            e.g. line terminators and quoting are kept as they are in the
+            input files. A line terminator is appended to input files not
+            ending with one, this is the last line terminator used by the
+            input file or the output dialect's ``lineterminator`` if the
+            input file contains none. ``before_row`` and ``after_row`` columns are
+            rendered once per input file and spliced into each row, this
+            requires an input dialect without ``escapechar``.
+            ``input_encoding`` must equal ``output_encoding`` and be
+            ASCII-compatible (e.g. UTF-8 or Latin-1, but not UTF-16). If
+            ``manage_headers`` is ``True``, the header row must not contain
+            line breaks.
+        read_ahead: Number of input files read ahead by a pool of as many
+            threads, while the current input file is processed. Only input
+            files with a known path and a size of up to 1 MiB are read ahead,
+            this overlaps opening and reading many small files. If ``0``,
+            input files are opened only when they are processed.
+
+    Configuration Options:
+
+        * ``buffer_size``: Size of the write buffer of the aggregate file in
+            bytes. The option is used when no ``buffer_size`` is passed to the
+            constructor. Defaults to 1 MiB.
     """
 
     def __init__(
@@ -133,13 +177,21 @@ class Collector(CollectorABC[ReadOpenable]):
         output_encoding: Optional[str] = None,
         output_errors: Optional[str] = None,
         output_csv_args: Optional[Mapping[str, Any]] = None,
+
+        buffer_size: Optional[int] = None,
+        copy_verbatim: bool = False,
+        read_ahead: int = 0,
     ):
         super(Collector, self).__init__()
+        if read_ahead < 0:
+            raise ValueError('read_ahead must not be negative')
 
         self._before_all: _Rows = _prepare_rows(before_all)
         self._after_all: _Rows = _prepare_rows(after_all)
         self._before: _RowsResolvable = _prepare_rows_resolvable(before)
         self._after: _RowsResolvable = _prepare_rows_resolvable(after)
+        self._resolve_before: Callable[[ParamSet], _Rows] = _rows_resolver(self._before)
+        self._resolve_after: Callable[[ParamSet], _Rows] = _rows_resolver(self._after)
         self._before_row: _RowResolvable = _prepare_row_resolvable(before_row)
         self._after_row: _RowResolvable = _prepare_row_resolvable(after_row)
 
@@ -147,6 +199,29 @@ class Collector(CollectorABC[ReadOpenable]):
             raise Exception('Invalid initialisation, cannot pass before_header_row or '
                 'after_header_row if manage_headers is False.')
 
+        input_dialect = csv.reader([], **(input_csv_args if input_csv_args is not None else {})).dialect
+        if (copy_verbatim and (before_row is not None or after_row is not None)
+                and input_dialect.escapechar is not None):
+            raise Exception('Invalid initialisation, cannot pass before_row or after_row '
+                'if copy_verbatim is True and the input dialect has an escapechar.')
+        if copy_verbatim and input_encoding != output_encoding:
+            raise Exception('Invalid initialisation, input_encoding and output_encoding '
+                'must be equal if copy_verbatim is True.')
+        if copy_verbatim and not _ascii_compatible(
+                input_encoding if input_encoding is not None else locale.getpreferredencoding(False)):
+            raise Exception('Invalid initialisation, copy_verbatim requires an '
+                'ASCII-compatible encoding.')
+
+        self._copy_verbatim: bool = copy_verbatim
+        self._read_ahead: int = read_ahead
+        # Used to find rows spanning multiple lines when copying verbatim.
+        self._input_quotechar: Optional[str] = (
+            input_dialect.quotechar if input_dialect.quoting != csv.QUOTE_NONE else None
+        )
+        self._input_delimiter: str = input_dialect.delimiter
+        self._input_doublequote: bool = input_dialect.doublequote
+        self._input_skipinitialspace: bool = input_dialect.skipinitialspace
+
         self._manage_headers: bool = manage_headers
         self._headers: Optional[List[str]] = None
         self._before_header_row: _RowResolvable = _prepare_row(before_header_row)
@@ -167,6 +242,10 @@ class Collector(CollectorABC[ReadOpenable]):
         self._output_encoding: Optional[str] = output_encoding
         self._output_errors: Optional[str] = output_errors
         self._output_csv_args: Mapping[str, Any] = output_csv_args if output_csv_args is not None else {}
+        # Constant rows are rendered once, rather than on every use.
+        self._before_all_text: str = _render_rows(self._before_all, self._output_csv_args)
+        self._after_all_text: str = _render_rows(self._after_all, self._output_csv_args)
+        self._buffer_size: Optional[int] = buffer_size
 
     @property
     def path(self) -> Union[str, bytes]:
@@ -179,6 +258,10 @@ class Collector(CollectorABC[ReadOpenable]):
         f = self._aggregate_file = open(
             self._aggregate_path,
             'wt',
+            buffering = (
+                self._buffer_size if self._buffer_size is not None
+                else config[Collector].get('buffer_size', AGGREGATE_BUFFER_SIZE)
+            ),
             encoding = self._output_encoding,
             errors = self._output_errors,
             newline = '',
@@ -186,7 +269,7 @@ class Collector(CollectorABC[ReadOpenable]):
         self._writer = csv.writer(f, **self._output_csv_args)
 
         if not self._manage_headers:
-            self._writer.writerows(self._before_all)
+            f.write(self._before_all_text)
             # Otherwise, _before_all is written after the headers.
 
         return self
@@ -199,7 +282,7 @@ class Collector(CollectorABC[ReadOpenable]):
             # Let's be consistent with _before_all: If _manage_headers,
             # neither _before_all nor _after_all are printed if headers are
             # not known, i.e. no files have been processed.
-            self._writer.writerows(self._after_all)
+            self._aggregate_file.write(self._after_all_text)
 
         self._writer = None
         self._aggregate_file.close()
@@ -211,7 +294,15 @@ class Collector(CollectorABC[ReadOpenable]):
         if self._aggregate_file is None or self._writer is None:
             raise Exception('Wrong usage. _aggregate_file is not set but is expected to be.')
 
+        if self._read_ahead > 0:
+            results = _read_ahead(results, self._read_ahead)
+
         for params, openable in results:
+            if self._copy_verbatim:
+                with openable.open_bytes() as binary:
+                    self._one_verbatim(params, cast('BinaryIO', binary), self._aggregate_file, self._writer)
+                continue
+
             with TextIOWrapper(
                 cast('BinaryIO', openable.open_bytes()),
                 encoding = self._input_encoding,
@@ -220,9 +311,22 @@ class Collector(CollectorABC[ReadOpenable]):
             ) as file:
                 reader = csv.reader(file, **self._input_csv_args)
 
-                self._one(params, reader, self._writer)
+                self._one(params, reader, self._aggregate_file, self._writer)
+
+    def _handle_header_row(self, params: ParamSet, header_row: List[str], f: TextIO, writer: _CSVWriter) -> None:
+        if self._headers is None:
+            self._headers = header_row
+
+            writer.writerow(itertools.chain(
+                resolve_iterable(self._before_header_row, params),
+                self._headers,
+                resolve_iterable(self._after_header_row, params),
+            ))
+            f.write(self._before_all_text)
+        elif header_row != self._headers:
+            raise Exception(f'Non-conforming headers encountered')
 
-    def _one(self, params: ParamSet, reader: _CSVReader, writer: _CSVWriter) -> None:
+    def _one(self, params: ParamSet, reader: _CSVReader, f: TextIO, writer: _CSVWriter) -> None:
         if self._manage_headers:
             try:
                 header_row = next(reader)
@@ -239,28 +343,272 @@ class Collector(CollectorABC[ReadOpenable]):
                 # the resolved rows.
                 return
 
-            if self._headers is None:
-                self._headers = header_row
+            self._handle_header_row(params, header_row, f, writer)
+
+        before_row = list(resolve_iterable(self._before_row, params))
+        after_row = list(resolve_iterable(self._after_row, params))
+
+        writer.writerows(self._resolve_before(params))
+
+        if len(before_row) == 0 and len(after_row) == 0:
+            writer.writerows(reader)
+        else:
+            # The reader yields lists, list concatenation is cheaper than
+            # chaining iterators for every row.
+            writer.writerows(before_row + row + after_row for row in reader)
+
+        writer.writerows(self._resolve_after(params))
 
-                writer.writerow(itertools.chain(
-                    resolve_iterable(self._before_header_row, params),
-                    self._headers,
-                    resolve_iterable(self._after_header_row, params),
-                ))
-                writer.writerows(self._before_all)
-            elif header_row != self._headers:
-                raise Exception(f'Non-conforming headers encountered')
+    def _one_verbatim(self, params: ParamSet, binary: BinaryIO, f: TextIO, writer: _CSVWriter) -> None:
+        if self._manage_headers:
+            header_line = binary.readline()
+            if len(header_line) == 0:
+                # Same strategy as in _one(): ignore empty files.
+                return
+
+            decoded = codecs.decode(
+                header_line,
+                self._input_encoding if self._input_encoding is not None else locale.getpreferredencoding(False),
+                self._input_errors if self._input_errors is not None else 'strict',
+            )
+            header_row = next(csv.reader([decoded], **self._input_csv_args), [])
+            self._handle_header_row(params, header_row, f, writer)
 
         before_row = list(resolve_iterable(self._before_row, params))
         after_row = list(resolve_iterable(self._after_row, params))
 
-        writer.writerows(_resolve_rows(self._before, params))
+        writer.writerows(self._resolve_before(params))
+
+        # Bytes are written directly to the binary buffer, pending text must
+        # be written first.
+        f.flush()
+
+        if len(before_row) == 0 and len(after_row) == 0:
+            read = binary.read
+            write = f.buffer.write
+
+            last_chunk = b''
+            # Last line terminator seen in the input.
+            terminator: Optional[bytes] = None
+            chunk = read(_VERBATIM_CHUNK_SIZE)
+            while len(chunk) > 0:
+                write(chunk)
+                end = chunk.rfind(b'\n')
+                if end >= 0:
+                    preceding = chunk[end - 1:end] if end > 0 else last_chunk[-1:]
+                    terminator = b'\r\n' if preceding == b'\r' else b'\n'
+                last_chunk = chunk
+                chunk = read(_VERBATIM_CHUNK_SIZE)
+
+            if len(last_chunk) > 0 and last_chunk[-1:] not in (b'\n', b'\r'):
+                if terminator is not None:
+                    write(terminator)
+                else:
+                    f.write(writer.dialect.lineterminator)
+        else:
+            self._splice_rows(binary, f.buffer, before_row, after_row, writer)
 
-        for row in reader:
-            writer.writerow(itertools.chain(
-                before_row,
-                row,
-                after_row,
-            ))
+        writer.writerows(self._resolve_after(params))
+
+    def _splice_rows(
+        self,
+        binary: BinaryIO,
+        out: BinaryIO,
+        before_row: List[Any],
+        after_row: List[Any],
+        writer: _CSVWriter,
+    ) -> None:
+        """Copies the rows of ``binary`` to ``out``, adding columns to each.
+
+        The columns are rendered with the output dialect once. The input is
+        read in blocks of whole lines. Blocks without quote characters and
+        empty lines using a single kind of line terminator are spliced as a
+        whole. Otherwise, lines are joined into rows by tracking whether a
+        quoted field is open at the end of a line, following the rules of
+        :func:`csv.reader`. Empty rows become rows of only the added
+        columns, as in the parsing path.
+        """
+
+        encoding = self._output_encoding if self._output_encoding is not None else locale.getpreferredencoding(False)
+        errors = self._output_errors if self._output_errors is not None else 'strict'
+        delimiter = writer.dialect.delimiter
+        lineterminator = writer.dialect.lineterminator
+
+        def render(columns: List[Any]) -> str:
+            return _render_rows([columns], self._output_csv_args)[:-len(lineterminator)]
+
+        prefix = (render(before_row) + delimiter).encode(encoding, errors) if len(before_row) > 0 else b''
+        suffix = (delimiter + render(after_row)).encode(encoding, errors) if len(after_row) > 0 else b''
+        empty_row = render(before_row + after_row).encode(encoding, errors)
+        default_terminator = lineterminator.encode(encoding, errors)
+        # Empty if quoting is disabled.
+        quote = self._input_quotechar.encode(encoding, errors) if self._input_quotechar is not None else b''
+        input_delimiter = self._input_delimiter.encode(encoding, errors)
+        doublequote = self._input_doublequote
+        skipinitialspace = self._input_skipinitialspace
+
+        write = out.write
+        quoted = False
+        pending: List[bytes] = []
+        # Appended to an unterminated last row: The last line terminator seen
+        # in the input, or the output dialect's if there is none.
+        last_terminator = default_terminator
+
+        def splice_lines(lines: Iterable[bytes]) -> None:
+            nonlocal quoted, last_terminator
+
+            for line in lines:
+                if quoted or (quote and quote in line):
+                    pending.append(line)
+                    quoted = _ends_in_quoted_field(
+                        line, quoted, quote, input_delimiter, doublequote, skipinitialspace,
+                    )
+                    if quoted:
+                        # A quoted field continues on the next line.
+                        continue
+
+                    line = b''.join(pending)
+                    pending.clear()
+
+                content = line.rstrip(b'\r\n')
+                if len(content) < len(line):
+                    last_terminator = line[len(content):]
+                if len(content) > 0:
+                    write(prefix + content + suffix + (line[len(content):] or last_terminator))
+                else:
+                    write(empty_row + (line or last_terminator))
+
+        read = binary.read
+        rest = b''
+        while True:
+            chunk = read(_VERBATIM_CHUNK_SIZE)
+            if len(chunk) == 0:
+                break
+
+            block = rest + chunk
+            end = block.rfind(b'\n') + 1
+            block, rest = block[:end], block[end:]
+            if len(block) == 0:
+                continue
+
+            terminator = _uniform_terminator(block)
+            if quoted or (quote and quote in block) or terminator is None:
+                splice_lines(BytesIO(block))
+            else:
+                # Every line is a non-empty row, the columns are added to all
+                # rows of the block at once.
+                write(
+                    prefix
+                    + block[:-len(terminator)].replace(terminator, suffix + terminator + prefix)
+                    + suffix + terminator
+                )
+                last_terminator = terminator
+
+        if len(rest) > 0:
+            splice_lines([rest])
+
+        if len(pending) > 0:
+            # Unterminated quoted field at the end of the file, which
+            # csv.reader closes implicitly.
+            write(prefix + b''.join(pending) + quote + suffix + last_terminator)
+
+
+def _render_rows(rows: _Rows, csv_args: Mapping[str, Any]) -> str:
+    """Returns ``rows`` as written by a CSV writer constructed with ``csv_args``."""
+
+    buf = StringIO()
+    csv.writer(buf, **csv_args).writerows(rows)
+    return buf.getvalue()
+
+
+def _ends_in_quoted_field(
+    line: bytes,
+    quoted: bool,
+    quote: bytes,
+    delimiter: bytes,
+    doublequote: bool,
+    skipinitialspace: bool,
+) -> bool:
+    """Returns whether a quoted field is open at the end of ``line``.
+
+    Follows the states of :func:`csv.reader` for a dialect without
+    ``escapechar``: A quote character only opens a quoted field at the start
+    of a field, elsewhere it is part of the field's content.
+
+    Args:
+        line: Line, including its line terminator.
+        quoted: Whether a quoted field is open at the start of ``line``.
+    """
 
-        writer.writerows(_resolve_rows(self._after, params))
+    i = 0
+    n = len(line)
+    field_start = not quoted
+
+    while i < n:
+        if quoted:
+            j = line.find(quote, i)
+            if j < 0:
+                return True
+            if doublequote and line[j + 1:j + 2] == quote:
+                # Escaped quote character within the quoted field.
+                i = j + 2
+                continue
+            quoted = False
+            field_start = False
+            i = j + 1
+            continue
+
+        if field_start:
+            if skipinitialspace:
+                while line[i:i + 1] == b' ':
+                    i += 1
+            if line[i:i + 1] == quote:
+                quoted = True
+                i += 1
+                continue
+
+        j = line.find(delimiter, i)
+        if j < 0:
+            return False
+        field_start = True
+        i = j + 1
+
+    return quoted
+
+
+def _uniform_terminator(block: bytes) -> Optional[bytes]:
+    """Returns the line terminator of all lines in ``block``.
+
+    ``block`` must end with a line terminator. ``None`` is returned if
+    ``block`` contains an empty line or both ``\\r\\n`` and ``\\n``
+    terminators or stray ``\\r`` characters.
+    """
+
+    newlines = block.count(b'\n')
+    carriage_returns = block.count(b'\r')
+    if carriage_returns == 0:
+        terminator = b'\n'
+    elif carriage_returns == newlines and block.count(b'\r\n') == newlines:
+        terminator = b'\r\n'
+    else:
+        return None
+
+    if block.startswith(terminator) or terminator + terminator in block:
+        return None
+
+    return terminator
+
+
+def _ascii_compatible(encoding: str) -> bool:
+    """Returns whether ``encoding`` encodes ASCII characters as ASCII bytes.
+
+    The verbatim copy splits and splices raw bytes at line terminators,
+    delimiters and quote characters, which requires single-byte ASCII
+    characters without a byte order mark.
+    """
+
+    sample = ''.join(chr(c) for c in range(128))
+    try:
+        return sample.encode(encoding) == sample.encode('ascii')
+    except UnicodeError:
+        return False
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+import functools
 import itertools
-from typing import Any, Dict, Iterable, Iterator, Tuple
+import operator
+from typing import Any, Callable, cast, Dict, Iterable, Iterator, Sized, Tuple
 
 from .params import ParamSet
 
@@ -17,6 +19,10 @@ class Generator(ABC):
 
     The ``Generator`` ABC is basically a standard python iterable, i.e. the
     ``__iter__`` method has to be defined and return an iterator.
+
+    Generators knowing the number of parameter sets they produce **may**
+    implement ``__len__``. The generators in this module do so, raising
+    ``TypeError`` if the number depends on an unsized iterable or generator.
     """
 
     @abstractmethod
@@ -36,17 +42,51 @@ class Literal(Generator):
     def __iter__(self) -> Iterator[ParamSet]:
         return iter([self._param_set])
 
+    def __len__(self) -> int:
+        return 1
+
 
 class Matrix(Generator):
     def __init__(self, **params: Iterable[Any]) -> None:
         super(Matrix, self).__init__()
         self._params: Dict[str, Iterable[Any]] = params
+        self._keys: Tuple[str, ...] = tuple(params.keys())
+        self._values: Tuple[Iterable[Any], ...] = tuple(params.values())
+        self._to_dict: Callable[[Tuple[Any, ...]], ParamSet] = _dict_func(self._keys)
 
     def __iter__(self) -> Iterator[ParamSet]:
-        return (
-            dict(zip(self._params.keys(), values))
-            for values in itertools.product(*self._params.values())
-        )
+        return map(self._to_dict, itertools.product(*self._values))
+
+    def __len__(self) -> int:
+        return _product_len(self._values)
+
+    def batches(self, size: int) -> Iterator[Dict[str, Tuple[Any, ...]]]:
+        """Returns an iterator over column-oriented batches of parameter sets.
+
+        Each batch maps every parameter to a tuple holding its values for up
+        to ``size`` consecutive parameter sets, in the order produced by
+        ``__iter__()``. Consumers able to process many parameter sets at once
+        may use this to avoid constructing a dict per parameter set.
+
+        Raises:
+            ValueError: If ``size`` is not positive.
+        """
+
+        if size <= 0:
+            raise ValueError(f'Invalid batch size {size!r}, must be positive')
+
+        return self._batches(size)
+
+    def _batches(self, size: int) -> Iterator[Dict[str, Tuple[Any, ...]]]:
+        keys = self._keys
+        it = itertools.product(*self._values)
+
+        while True:
+            chunk = tuple(itertools.islice(it, size))
+            if len(chunk) == 0:
+                return
+
+            yield dict(zip(keys, zip(*chunk)))
 
 
 class Repeat(Generator):
@@ -65,10 +105,16 @@ class Repeat(Generator):
                     yield params
 
         """
+        if self._n == 1:
+            return iter(self._generator)
+
         return itertools.chain.from_iterable(
-            (itertools.repeat(params, self._n) for params in self._generator)
+            map(itertools.repeat, self._generator, itertools.repeat(self._n))
         )
 
+    def __len__(self) -> int:
+        return len(cast(Sized, self._generator)) * self._n
+
 
 class Chain(Generator):
     def __init__(self, *generators: Generator) -> None:
@@ -78,19 +124,58 @@ class Chain(Generator):
     def __iter__(self) -> Iterator[ParamSet]:
         return itertools.chain(*self._generators)
 
+    def __len__(self) -> int:
+        return sum(len(cast(Sized, generator)) for generator in self._generators)
+
 
 class Product(Generator):
     def __init__(self, *generators: Generator) -> None:
         super(Product, self).__init__()
         self._generators: Tuple[Generator, ...] = generators
+        self._merge: Callable[[Tuple[ParamSet, ...]], ParamSet] = _merge_func(len(generators))
 
     def __iter__(self) -> Iterator[ParamSet]:
-        return (
-            dict(itertools.chain.from_iterable(
-                params.items() for params in param_sets
-            ))
-            for param_sets in itertools.product(*self._generators)
-        )
+        return map(self._merge, itertools.product(*self._generators))
+
+    def __len__(self) -> int:
+        return _product_len(self._generators)
+
+
+def _product_len(iterables: Iterable[Iterable[Any]]) -> int:
+    """Returns the number of elements of the cartesian product of ``iterables``.
+
+    Raises:
+        TypeError: If any of ``iterables`` is not sized.
+    """
+
+    return functools.reduce(operator.mul, (len(cast(Sized, it)) for it in iterables), 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _merge_func(n: int) -> Callable[[Tuple[ParamSet, ...]], ParamSet]:
+    """Returns a function merging a tuple of ``n`` parameter sets into a dict.
+
+    The function is compiled from the dict display ``{**p[0], **p[1], ...}``.
+    This merges all parameter sets within a single expression rather than
+    calling ``dict.update()`` from a Python loop. Later parameter sets take
+    precedence, as with ``dict.update()``.
+    """
+
+    source = 'lambda p: {' + ', '.join(f'**p[{i}]' for i in range(n)) + '}'
+    return cast('Callable[[Tuple[ParamSet, ...]], ParamSet]', eval(source))
+
+
+@functools.lru_cache(maxsize=None)
+def _dict_func(keys: Tuple[str, ...]) -> Callable[[Tuple[Any, ...]], ParamSet]:
+    """Returns a function creating a dict from a tuple of values for ``keys``.
+
+    The function is compiled from the dict display ``{keys[0]: v[0], ...}``
+    with the keys as constants, which is considerably faster than
+    ``dict(zip(keys, v))``.
+    """
+
+    source = 'lambda v: {' + ', '.join(f'{key!r}: v[{i}]' for i, key in enumerate(keys)) + '}'
+    return cast('Callable[[Tuple[Any, ...]], ParamSet]', eval(source))
 
 
 class FromIterable(Generator):
@@ -100,3 +185,6 @@ class FromIterable(Generator):
 
     def __iter__(self) -> Iterator[ParamSet]:
         return iter(self._it)
+
+    def __len__(self) -> int:
+        return len(cast(Sized, self._it))
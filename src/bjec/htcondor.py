@@ -1,20 +1,18 @@
-from collections import ChainMap
+from collections import ChainMap, deque
 from contextlib import ExitStack
 from dataclasses import dataclass, field, replace
 from enum import IntEnum
-import errno
 import itertools
 import logging
 import os
-from random import Random
-from shutil import which
-from tempfile import gettempdir, mkstemp, TMP_MAX
+from shutil import rmtree, which
+from tempfile import gettempdir, mkdtemp
 from time import sleep
 from types import TracebackType
-from typing import Any, AnyStr, Callable, cast, Dict, Iterable, Iterator, List, Mapping, Optional, SupportsInt, Tuple, Type, Union
+from typing import Any, Callable, cast, Deque, Dict, Iterable, Iterator, List, Mapping, Optional, Set, SupportsInt, Tuple, Type, Union
 
 from classad import ClassAd
-from htcondor import JobAction, Schedd, Submit
+from htcondor import JobAction, JobEvent, JobEventLog, JobEventType, Schedd, Submit
 
 from .config import config
 from .io import PathType, PrimitivePathType, resolve_abs_path
@@ -178,22 +176,16 @@ def _opt_int(value: Optional[_Intable]) -> Optional[int]:
     else:
         return int(value)
 
-def _contains_any(s: str, what: Iterable[str]) -> bool:
-    for c in what:
-        if c in s:
-            return True
-
-    return False
-
 def _quote(token: str) -> str:
-    quote_wrap = _contains_any(token, ' \t\'')
-
-    quoted = token.replace('\'', '\'\'').replace('"', '""')
+    # Membership tests on the token are cheaper than scanning it with a
+    # Python loop or translate() for the short tokens of typical commands.
+    if '\'' in token or '"' in token:
+        quoted = token.replace('\'', '\'\'').replace('"', '""')
+    else:
+        quoted = token
 
-    if quote_wrap:
+    if ' ' in token or '\t' in token or '\'' in token or len(token) == 0:
         return '\'' + quoted + '\''
-    elif len(token) == 0:
-        return '\'' + token + '\''
     else:
         return quoted
 
@@ -221,7 +213,7 @@ def _args_to_str(args: Iterable[str]) -> str:
     https://htcondor.readthedocs.io/en/stable/man-pages/condor_submit.html
     """
 
-    return '"' + ' '.join(_quote(arg) for arg in args) + '"'
+    return '"' + ' '.join([_quote(arg) for arg in args]) + '"'
 
 def _environment_to_str(environment: Mapping[str, str]) -> str:
     """
@@ -248,7 +240,7 @@ def _environment_to_str(environment: Mapping[str, str]) -> str:
     https://htcondor.readthedocs.io/en/stable/man-pages/condor_submit.html
     """
 
-    return '"' + ' '.join(f'{key}={_quote(value)}' for key, value in environment.items()) + '"'
+    return '"' + ' '.join([f'{key}={_quote(value)}' for key, value in environment.items()]) + '"'
 
 def _file_remaps_to_str(remaps: Mapping[str, str]) -> str:
     """
@@ -280,7 +272,7 @@ def _file_remaps_to_str(remaps: Mapping[str, str]) -> str:
     def esc_v(s: str) -> str:
         return s.replace(';', '\\;')
 
-    return '"' + ';'.join(f'{esc_k(key)}={esc_v(value)}' for key, value in remaps.items()) + '"'
+    return '"' + ';'.join([f'{esc_k(key)}={esc_v(value)}' for key, value in remaps.items()]) + '"'
 
 def _files_to_str(files: Iterable[str]) -> str:
     """
@@ -303,13 +295,14 @@ def _path_to_str(path: PrimitivePathType) -> str:
     else:
         return os.fsdecode(path)
 
-def _get_poll_sleep_times(first: int=10, max: int=600) -> Iterator[int]:
-    cur = first
-    while cur < max:
-        yield cur
-        cur *= 2
-    for val in itertools.repeat(max):
-        yield val
+_DEFAULT_POLL_INTERVAL: float = 5
+"""Default interval between queries of the state of submitted jobs, in seconds."""
+
+_MAX_RETRY_INTERVAL: float = 600
+"""Upper bound of the interval between retries of failed queries, in seconds."""
+
+
+_logger = logging.getLogger(__name__)
 
 
 class _ProcessFailedError(Exception):
@@ -327,24 +320,15 @@ class _Status(IntEnum):
 
     @classmethod
     def from_value(cls, val: Union[int, _Intable]) -> '_Status':
-        int_val = val if isinstance(val, int) else int(val)
-
-        if int_val == _Status.UNEXPANDED:
-            return _Status.UNEXPANDED
-        elif int_val == _Status.IDLE:
-            return _Status.IDLE
-        elif int_val == _Status.RUNNING:
-            return _Status.RUNNING
-        elif int_val == _Status.REMOVED:
-            return _Status.REMOVED
-        elif int_val == _Status.COMPLETED:
-            return _Status.COMPLETED
-        elif int_val == _Status.HELD:
-            return _Status.HELD
-        elif int_val == _Status.SUBMISSION_ERR:
-            return _Status.SUBMISSION_ERR
-        else:
-            raise ValueError(val)
+        return cls(val if isinstance(val, int) else int(val))
+
+
+_JOB_STATE_PROJECTION: List[str] = [
+    'ClusterId', 'ProcId', 'JobStatus', 'ExitCode', 'ExitBySignal', 'ExitSignal',
+]
+
+
+_STATUS_PROJECTION: List[str] = ['ProcId', 'JobStatus']
 
 
 @dataclass
@@ -368,15 +352,28 @@ class _JobState:
             proc_id = int(cast(_Intable, class_ad['ProcId'])),
             job_status = _Status.from_value(cast(_Intable, class_ad['JobStatus'])),
             exit_code = _opt_int(cast('Optional[_Intable]', class_ad.get('ExitCode'))),
-            exit_by_signal = class_ad.get('ExitBySignal', 'false') == 'true',
+            exit_by_signal = class_ad.get('ExitBySignal', False) in (True, 'true'),
             exit_signal = _opt_int(cast('Optional[_Intable]', class_ad.get('ExitSignal'))),
         )
 
+    @classmethod
+    def from_terminated_event(cls, event: JobEvent) -> '_JobState':
+        terminated_normally = bool(event.get('TerminatedNormally', True))
+        return cls(
+            cluster_id = event.cluster,
+            proc_id = event.proc,
+            job_status = _Status.COMPLETED,
+            exit_code = _opt_int(event.get('ReturnValue')) if terminated_normally else None,
+            exit_by_signal = not terminated_normally,
+            exit_signal = None if terminated_normally else _opt_int(event.get('TerminatedBySignal')),
+        )
+
     @staticmethod
     def projection() -> List[str]:
-        return [
-            'ClusterId', 'ProcId', 'JobStatus', 'ExitCode', 'ExitBySignal', 'ExitSignal',
-        ]
+        return _JOB_STATE_PROJECTION
+
+
+_STATUS_FIELDS: Dict[int, str] = {status: status.name.lower() for status in _Status}
 
 
 @dataclass
@@ -402,50 +399,17 @@ class _StatusCounts(object):
         )
 
     def __getitem__(self, key: int) -> int:
-        if key == _Status.UNEXPANDED:
-            return self.unexpanded
-        elif key == _Status.IDLE:
-            return self.idle
-        elif key == _Status.RUNNING:
-            return self.running
-        elif key == _Status.REMOVED:
-            return self.removed
-        elif key == _Status.COMPLETED:
-            return self.completed
-        elif key == _Status.HELD:
-            return self.held
-        elif key == _Status.SUBMISSION_ERR:
-            return self.submission_err
-        else:
-            raise KeyError(key)
+        return cast(int, getattr(self, self._field(key)))
 
     def __setitem__(self, key: int, val: int) -> None:
-        if key == _Status.UNEXPANDED:
-            self.unexpanded = val
-        elif key == _Status.IDLE:
-            self.idle = val
-        elif key == _Status.RUNNING:
-            self.running = val
-        elif key == _Status.REMOVED:
-            self.removed = val
-        elif key == _Status.COMPLETED:
-            self.completed = val
-        elif key == _Status.HELD:
-            self.held = val
-        elif key == _Status.SUBMISSION_ERR:
-            self.submission_err = val
-        else:
-            raise KeyError(key)
+        setattr(self, self._field(key), val)
 
-    def add_job(self, job: Union[ClassAd, _JobState]) -> None:
-        if isinstance(job, _JobState):
-            self[job.job_status] += 1
-        else:
-            self[int(cast(int, job['JobStatus']))] += 1
-
-    def add_jobs(self, jobs: Iterable[Union[ClassAd, _JobState]]) -> None:
-        for job in jobs:
-            self.add_job(job)
+    @staticmethod
+    def _field(key: int) -> str:
+        try:
+            return _STATUS_FIELDS[key]
+        except KeyError:
+            raise KeyError(key) from None
 
 
 class Job(object):
@@ -668,10 +632,20 @@ class HTCondor(Processor[Result]):
             unset, the configuration option of the same name is used. The system default as
             determined by :func:`gettempdir` (e.g. ``/tmp``) is used if the configuration option is
             not set.
+        poll_interval: Interval between queries of the state of submitted jobs, in seconds. If
+            unset, the configuration option of the same name is used. Defaults to 5 seconds if the
+            configuration option is not set. If a query fails, the interval is doubled for each
+            consecutive failure (up to 10 minutes) and reset after the next successful query.
+        cluster_size: Maximum number of jobs submitted in one cluster. If unset, the configuration
+            option of the same name is used. All jobs are submitted in a single cluster if the
+            configuration option is not set. Otherwise the next cluster is submitted while the
+            results of the previous one are awaited and results are yielded cluster by cluster.
 
     Configuration Options:
 
         * ``temp_dir``: Directory in which temporary files and links are created while processing.
+        * ``poll_interval``: Interval between queries of the state of submitted jobs, in seconds.
+        * ``cluster_size``: Maximum number of jobs submitted in one cluster.
 
     Todo:
         * Additional arguments (config, constructor):
@@ -682,10 +656,14 @@ class HTCondor(Processor[Result]):
         self,
         schedd: Optional[Schedd] = None,
         temp_dir: Optional[str] = None,
+        poll_interval: Optional[float] = None,
+        cluster_size: Optional[int] = None,
     ) -> None:
         super(HTCondor, self).__init__()
         self._schedd: Schedd = schedd if schedd is not None else Schedd()
         self._temp_dir: str = self._temp_dir_value(temp_dir)
+        self._poll_interval: float = self._poll_interval_value(poll_interval)
+        self._cluster_size: Optional[int] = self._cluster_size_value(cluster_size)
 
         self._cleanup_handlers: HandlersList = HandlersList()
 
@@ -696,6 +674,20 @@ class HTCondor(Processor[Result]):
             return cast(str, config[HTCondor]['temp_dir'])
         return gettempdir()
 
+    def _poll_interval_value(self, poll_interval: Optional[float]) -> float:
+        if poll_interval is not None:
+            return poll_interval
+        if 'poll_interval' in config[HTCondor]:
+            return float(config[HTCondor]['poll_interval'])
+        return _DEFAULT_POLL_INTERVAL
+
+    def _cluster_size_value(self, cluster_size: Optional[int]) -> Optional[int]:
+        if cluster_size is None and 'cluster_size' in config[HTCondor]:
+            cluster_size = int(config[HTCondor]['cluster_size'])
+        if cluster_size is not None and cluster_size < 1:
+            raise ValueError('cluster_size must be positive')
+        return cluster_size
+
     def __exit__(self, *args: Any) -> Optional[bool]:
         self._cleanup_handlers()
         self._cleanup_handlers.clear()
@@ -720,45 +712,72 @@ class HTCondor(Processor[Result]):
         if job.process._working_directory is not None:
             raise Exception('HTCondor does not support setting the working_directory on Process')
 
-        with ExitStack() as stack:
-            cluster_generator = _JobClusterGenerator(self, job, params_it)
-            stack.enter_context(cluster_generator)
+        if self._cluster_size is None:
+            return self._run_clusters(job, [params_it])
+        else:
+            return self._run_clusters(job, _chunks(params_it, self._cluster_size))
 
-            submit = Submit()
+    def _run_clusters(
+        self, job: Job, chunks: Iterable[Iterable[ParamSet]],
+    ) -> Iterator[Tuple[ParamSet, Result]]:
+        """Submits one cluster per chunk and yields the results cluster by cluster.
 
-            with self._schedd.transaction() as txn:
-                submit_result = submit.queue_with_itemdata(txn, itemdata=iter(cluster_generator))
+        The next cluster is submitted before waiting for the previous one, so
+        that submission and execution overlap.
+        """
+        with ExitStack() as stack:
+            pending: Deque[Tuple[_JobClusterGenerator, int, ExitStack]] = deque()
 
-            stack.callback(
-                self._schedd.act, JobAction.Remove, f'ClusterId == {submit_result.cluster()}',
-            )
+            for chunk in chunks:
+                cluster_stack = stack.enter_context(ExitStack())
+                cluster_generator, cluster_id = self._submit_cluster(cluster_stack, job, chunk)
+                pending.append((cluster_generator, cluster_id, cluster_stack))
 
-            job_states: Dict[int, _JobState] = {}
+                if len(pending) > 1:
+                    yield from self._cluster_results(job, *pending.popleft())
 
-            for sleep_time in _get_poll_sleep_times():
-                sleep(sleep_time)
+            while pending:
+                yield from self._cluster_results(job, *pending.popleft())
 
-                query_result = self._schedd.xquery(
-                    requirements = f'ClusterId == {submit_result.cluster()}',
-                    projection = _JobState.projection(),
-                )
+    def _submit_cluster(
+        self, stack: ExitStack, job: Job, params_it: Iterable[ParamSet],
+    ) -> Tuple['_JobClusterGenerator', int]:
+        cluster_generator = _JobClusterGenerator(self, job, params_it)
+        stack.enter_context(cluster_generator)
 
-                job_states.clear()
-                for job_state_ad in query_result:
-                    job_state = _JobState.from_class_ad(job_state_ad)
-                    job_states[job_state.proc_id] = job_state
+        submit = Submit()
 
-                counts = _StatusCounts()
-                counts.add_jobs(job_states.values())
+        with self._schedd.transaction() as txn:
+            submit_result = submit.queue_with_itemdata(txn, itemdata=iter(cluster_generator))
 
-                print(counts)
+        cluster_id = submit_result.cluster()
+        stack.callback(self._schedd.act, JobAction.Remove, f'ClusterId == {cluster_id}')
 
-                if counts.completed == counts.total:
-                    break
+        return cluster_generator, cluster_id
 
-            results: List[Tuple[ParamSet, Result]] = []
-            for proc_id, process in enumerate(cluster_generator.processes):
-                job_state = job_states[proc_id]
+    def _cluster_results(
+        self,
+        job: Job,
+        cluster_generator: '_JobClusterGenerator',
+        cluster_id: int,
+        stack: ExitStack,
+    ) -> Iterator[Tuple[ParamSet, Result]]:
+        """Yields the results of the cluster as its processes complete.
+
+        ``stack`` is closed once all processes have completed.
+        """
+        with stack:
+            num_procs = len(cluster_generator.processes)
+            event_log_path = cluster_generator.event_log_path
+
+            completed: Iterator[_JobState]
+            if event_log_path is not None:
+                completed = self._follow_event_log(event_log_path, cluster_id, num_procs)
+            else:
+                completed = self._poll_completed(cluster_id)
+
+            for job_state in completed:
+                process = cluster_generator.processes[job_state.proc_id]
                 if job_state.exit_by_signal:
                     raise _ProcessFailedError(
                         f'Process exited due to receiving signal {job_state.exit_signal}',
@@ -768,11 +787,121 @@ class HTCondor(Processor[Result]):
 
                 result = process.result(job_state.exit_code)
                 self._check_for_failure(job, result, process.params)
-                results.append((process.params, result))
+                yield process.params, result
 
             self._cleanup_handlers += cluster_generator.cleanup_handlers
+            self._cleanup_handlers.callback(
+                rmtree, cluster_generator.temp_dir, ignore_errors=True,
+            )
+
+    def _follow_event_log(
+        self, event_log_path: str, cluster_id: int, num_procs: int,
+    ) -> Iterator[_JobState]:
+        """Yields the state of each process of the cluster once it has terminated.
+
+        Follows the cluster's job event log instead of querying the schedd
+        repeatedly.
+        """
+        remaining = set(range(num_procs))
+        stop_after = max(1, int(self._poll_interval))
+
+        with JobEventLog(event_log_path) as event_log:
+            while remaining:
+                for event in event_log.events(stop_after=stop_after):
+                    if event.cluster != cluster_id or event.proc not in remaining:
+                        continue
+                    if event.type == JobEventType.JOB_TERMINATED:
+                        remaining.discard(event.proc)
+                        yield _JobState.from_terminated_event(event)
+                    elif event.type == JobEventType.JOB_ABORTED:
+                        raise _ProcessFailedError(
+                            f'Process {cluster_id}.{event.proc} was removed from the queue',
+                        )
+
+                    if not remaining:
+                        break
+
+    def _poll_completed(self, cluster_id: int) -> Iterator[_JobState]:
+        """Queries the schedd until all processes of the cluster are completed.
+
+        Yields the state of each process once it is completed. Each poll only
+        queries the status of the processes, the full state is queried only for
+        processes which have newly completed.
+        """
+        sleep_time = self._poll_interval
+        statuses: Dict[int, _Status] = {}
+        counts = _StatusCounts()
+        unreported: Set[int] = set()
+
+        while True:
+            sleep(sleep_time)
+
+            try:
+                status_ads = list(self._schedd.xquery(
+                    requirements = f'ClusterId == {cluster_id}',
+                    projection = _STATUS_PROJECTION,
+                ))
+            except (OSError, RuntimeError) as e:
+                sleep_time = self._retry_interval(sleep_time, e)
+                continue
+
+            # Only update counts for processes whose status changed since the
+            # previous query.
+            previous_statuses = statuses
+            statuses = {}
+            for status_ad in status_ads:
+                proc_id = int(cast(_Intable, status_ad['ProcId']))
+                status = _Status.from_value(cast(_Intable, status_ad['JobStatus']))
+                statuses[proc_id] = status
+
+                previous = previous_statuses.pop(proc_id, None)
+                if previous is None:
+                    counts[status] += 1
+                elif previous != status:
+                    counts[previous] -= 1
+                    counts[status] += 1
+                else:
+                    continue
+
+                if status == _Status.COMPLETED:
+                    unreported.add(proc_id)
 
-        return iter(results)
+            for previous in previous_statuses.values():
+                counts[previous] -= 1
+
+            _logger.debug('Cluster %s: %s', cluster_id, counts)
+
+            if unreported:
+                proc_ids = ', '.join([str(proc_id) for proc_id in sorted(unreported)])
+                try:
+                    completed_ads = list(self._schedd.xquery(
+                        requirements = f'ClusterId == {cluster_id} && member(ProcId, {{{proc_ids}}})',
+                        projection = _JOB_STATE_PROJECTION,
+                    ))
+                except (OSError, RuntimeError) as e:
+                    sleep_time = self._retry_interval(sleep_time, e)
+                    continue
+
+                for completed_ad in completed_ads:
+                    job_state = _JobState.from_class_ad(completed_ad)
+                    if job_state.proc_id in unreported:
+                        unreported.discard(job_state.proc_id)
+                        yield job_state
+
+            sleep_time = self._poll_interval
+
+            if counts.completed == counts.total and not unreported:
+                return
+
+    def _retry_interval(self, sleep_time: float, e: Exception) -> float:
+        """Returns the interval to wait after a failed query of the schedd.
+
+        The interval is doubled for every consecutive failure, until the
+        schedd becomes reachable again.
+        """
+        sleep_time = min(2 * sleep_time, max(_MAX_RETRY_INTERVAL, self._poll_interval))
+        _logger.warning('Querying the schedd failed, retrying in %s s: %s', sleep_time, e)
+        return sleep_time
 
     def _check_for_failure(self, job: Job, result: Result, params: ParamSet) -> None:
         failure_mode = job.with_params(params).process.failure_mode
@@ -822,6 +951,9 @@ class _JobClusterGenerator(object):
         self._processes: List[_JobClusterGenerator._ProcessInfo] = []
         self._cleanup_handlers: HandlersList = HandlersList()
         self._stack: ExitStack = ExitStack()
+        self._temp_dir: str = htcondor._temp_dir
+        self._temp_names: Iterator[int] = itertools.count()
+        self._event_log_path: Optional[str] = None
 
     @property
     def cleanup_handlers(self) -> HandlersList:
@@ -831,9 +963,35 @@ class _JobClusterGenerator(object):
     def processes(self) -> 'List[_JobClusterGenerator._ProcessInfo]':
         return self._processes
 
+    @property
+    def temp_dir(self) -> str:
+        """Directory holding the temporary files and links of this cluster.
+
+        The directory is created on entering and must be removed after the
+        cleanup handlers have been called. Temporary files in the directory
+        have no cleanup handlers of their own.
+        """
+        return self._temp_dir
+
+    @property
+    def event_log_path(self) -> Optional[str]:
+        """Path of the job event log shared by all processes of the cluster.
+
+        ``None`` if the job log is captured, every process then writes its
+        own log.
+        """
+        return self._event_log_path
+
     def __enter__(self) -> '_JobClusterGenerator':
         self._stack.__enter__()
+        self._temp_dir = mkdtemp(dir=self._htcondor._temp_dir, prefix='bjec-')
+        self._stack.enter_context(
+            CallbackOnException(rmtree, self._temp_dir, ignore_errors=True),
+        )
         self._stack.enter_context(CallbackOnException(self._cleanup_handlers))
+        if not self._job.log.capture:
+            self._event_log_path = self._temp_path('events')
+            _create_file(self._event_log_path)
         return self
 
     def __exit__(
@@ -878,7 +1036,7 @@ class _JobClusterGenerator(object):
 
             self._processes.append(info)
 
-            print(data)
+            _logger.debug('Submitting process: %s', data)
 
             yield data
 
@@ -931,16 +1089,12 @@ class _JobClusterGenerator(object):
     ) -> Dict[str, str]:
         self._prepare_std_files(job, data, info)
 
-        temp_dir = self._htcondor._temp_dir
-
         info.input_files = [
-            prepare_input_file(spec, self._stack, self._cleanup_handlers, temp_dir=temp_dir)
-            for spec in job.process.input_files
+            self._prepare_input_file(spec) for spec in job.process.input_files
         ]
 
         info.output_files = [
-            prepare_output_file(spec, self._stack, self._cleanup_handlers, temp_dir=temp_dir)
-            for spec in job.process.output_files
+            self._prepare_output_file(spec) for spec in job.process.output_files
         ]
 
         data.update(
@@ -962,110 +1116,75 @@ class _JobClusterGenerator(object):
         data: Dict[str, str],
         info: '_JobClusterGenerator._ProcessInfo',
     ) -> None:
-        temp_dir = self._htcondor._temp_dir
         if job.process.stdin.connected:
-            info.stdin = stdin = prepare_input_file(
-                job.process.stdin, self._stack, self._cleanup_handlers, name='stdin',
-                temp_dir=temp_dir,
-            )
+            info.stdin = self._prepare_input_file(job.process.stdin, name='stdin')
             data['input'] = _path_to_str(info.stdin.open_path)
         if job.process.stdout.capture:
-            info.stdout = prepare_output_file(
-                job.process.stdout, self._stack, self._cleanup_handlers, name='stdout',
-                temp_dir=temp_dir,
-            )
+            info.stdout = self._prepare_output_file(job.process.stdout, name='stdout')
             data['output'] = _path_to_str(info.stdout.open_path)
         if job.process.stderr.capture:
-            info.stderr = prepare_output_file(
-                job.process.stderr, self._stack, self._cleanup_handlers, name='stderr',
-                temp_dir=temp_dir,
-            )
+            info.stderr = self._prepare_output_file(job.process.stderr, name='stderr')
             data['error'] = _path_to_str(info.stderr.open_path)
         if job.log.capture:
-            info.log = prepare_output_file(
-                job.log, self._stack, self._cleanup_handlers, name='log',
-                temp_dir=temp_dir,
-            )
+            info.log = self._prepare_output_file(job.log, name='log')
             data['log'] = _path_to_str(info.log.open_path)
+        elif self._event_log_path is not None:
+            data['log'] = self._event_log_path
 
     def _prepare_input_file_for_transfer(self, spec: Process.InputFile) -> FileDescriptor:
-        temp_dir = self._htcondor._temp_dir
-        desc = prepare_input_file(spec, self._stack, self._cleanup_handlers, temp_dir=temp_dir)
+        desc = self._prepare_input_file(spec)
         if not desc.temporary:
-            if isinstance(desc.open_path, str):
-                link_path = _make_temp_link(desc.open_path, temp_dir)
-            elif isinstance(desc.open_path, bytes):
-                link_path = _make_temp_link(_path_to_str(desc.open_path), temp_dir)
-            self._stack.callback(os.unlink, link_path)
+            link_path = self._temp_path('input')
+            os.symlink(_path_to_str(desc.open_path), link_path)
             desc = replace(desc, process_path=link_path)
         return desc
 
     def _prepare_output_file_for_transfer(self, spec: Process.OutputFile) -> FileDescriptor:
-        temp_dir = self._htcondor._temp_dir
-        desc = prepare_output_file(spec, self._stack, self._cleanup_handlers, temp_dir=temp_dir)
+        desc = self._prepare_output_file(spec)
         if not desc.temporary:
-            fd, file_path = mkstemp(dir=temp_dir)
-            os.close(fd)
-            self._stack.callback(os.unlink, file_path)
+            file_path = self._temp_path('output')
+            _create_file(file_path)
             desc = replace(desc, process_path=file_path)
         return desc
 
+    def _prepare_input_file(
+        self, spec: Union[Process.InputFile, Process.Stdin], name: str = '',
+    ) -> FileDescriptor:
+        return prepare_input_file(
+            spec, self._stack, self._cleanup_handlers, name=name, temp_dir=self._temp_dir,
+            cleanup_temporary=False,
+        )
 
-def _lookup_cmd(cmd: str) -> str:
-    cmd_path = cmd if os.path.isabs(cmd) else which(cmd)
-    if cmd_path is None:
-        raise Exception(f'Failed to locate ("which") command {cmd!r}')
-    return cmd_path
-
-def _rand_name_it(length: int=8) -> Iterator[str]:
-    c = 'abcdefghijklmnopqrstuvwxyz0123456789_'
-    random = Random()
-
-    return (''.join(random.choice(c) for _ in range(length)) for _ in itertools.repeat(None))
-
-def _make_temp_link(
-    orig: AnyStr,
-    dir: AnyStr,
-    prefix: Optional[AnyStr] = None,
-    suffix: Optional[AnyStr] = None,
-) -> AnyStr:
-    """Creates a symlink using a mechanism suitable for a temporary directory.
-
-    The function behaves safely in concurrent scenarios: The ``symlink``
-    syscall atomically creates a symlink or fails. Many random names are tried
-    before raising an exception if an existing files with the randomised name
-    is discovered.
-
-    Adapted from the Python standard library, dropped Windows special case.
-    https://github.com/python/cpython/blob/e65b3fa9f16537d20f5f37c25673ac899fcd7099/Lib/tempfile.py#L247
+    def _prepare_output_file(
+        self, spec: Union[Process.OutputFile, Process.Stdout], name: str = '',
+    ) -> FileDescriptor:
+        return prepare_output_file(
+            spec, self._stack, self._cleanup_handlers, name=name, temp_dir=self._temp_dir,
+            cleanup_temporary=False,
+        )
 
-    Args:
-        orig: Path which the symlink should point to.
-        dir: Directory in which the symlink should be created.
-        prefix: Prefix before the random part of the symlink.
-        suffix: Suffix after the random part of the symlink.
-    """
+    def _temp_path(self, kind: str) -> str:
+        """Returns a new path in the cluster's temporary directory.
 
-    names: Iterator[AnyStr]
-    pre: AnyStr
-    suf: AnyStr
-    if isinstance(orig, bytes):
-        names = map(os.fsencode, _rand_name_it())
-        pre = prefix if prefix is not None else os.fsencode('')
-        suf = suffix if suffix is not None else os.fsencode('')
-    else:
-        names = _rand_name_it()
-        pre = prefix if prefix is not None else ''
-        suf = suffix if suffix is not None else ''
+        The directory is created empty on entering, a counter suffices to
+        generate unique names.
+        """
+        return os.path.join(self._temp_dir, f'{next(self._temp_names):08d}_{kind}')
 
-    files = map(lambda n: os.path.join(dir, pre + n + suf), names)
 
-    for file, _ in zip(files, range(TMP_MAX)):
-        try:
-            os.symlink(orig, file)
-        except FileExistsError:
-            continue
+def _create_file(path: str) -> None:
+    fd = os.open(path, os.O_WRONLY|os.O_CREAT|os.O_EXCL, 0o600)
+    os.close(fd)
 
-        return os.path.abspath(file)
+def _chunks(params_it: Iterable[ParamSet], size: int) -> Iterator[List[ParamSet]]:
+    it = iter(params_it)
+    chunk = list(itertools.islice(it, size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(it, size))
 
-    raise FileExistsError(errno.EEXIST, 'No usable temporary file name found')
+def _lookup_cmd(cmd: str) -> str:
+    cmd_path = cmd if os.path.isabs(cmd) else which(cmd)
+    if cmd_path is None:
+        raise Exception(f'Failed to locate ("which") command {cmd!r}')
+    return cmd_path
@@ -1,8 +1,13 @@
-from io import BufferedIOBase, BufferedWriter, FileIO, TextIOBase, TextIOWrapper, RawIOBase
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import errno
+from io import BufferedIOBase, BufferedWriter, BytesIO, FileIO, TextIOBase, TextIOWrapper, RawIOBase
+import os
 from os import fspath, PathLike
 import os.path
+import stat
 from shutil import copyfileobj
-from typing import Any, BinaryIO, Callable, cast, Optional, TextIO, TYPE_CHECKING, Union
+from typing import Any, BinaryIO, Callable, cast, Deque, Iterable, Iterator, List, Optional, TextIO, Tuple, TYPE_CHECKING, TypeVar, Union
 from typing_extensions import Protocol
 
 from .params import ParamSet, Resolvable, resolve
@@ -34,6 +39,10 @@ else:
 
 PathType = Union[str, bytes, _AnyPathLike]
 PrimitivePathType = Union[str, bytes]
+_BinaryFile = Union[BinaryIO, BufferedIOBase]
+
+AGGREGATE_BUFFER_SIZE: int = 1024 * 1024
+"""Default size of the write buffer of aggregate files, in bytes."""
 # _Source = Union['Writeable', str, bytes] # or _ExtendedWriteable
 
 
@@ -167,6 +176,91 @@ class ReadOpenableWrapBinaryIO(ReadOpenable):
         return self._rebuffered()
 
 
+class ReadOpenableFromBytes(ReadOpenable):
+    def __init__(self, content: bytes) -> None:
+        self._content: bytes = content
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    def open_text(
+        self,
+        encoding: Optional[str] = None,
+        errors: Optional[str] = None,
+        newline: Optional[str] = None,
+    ) -> TextIOBase:
+        return cast(TextIOBase, TextIOWrapper(
+            BytesIO(self._content),
+            encoding = encoding,
+            errors = errors,
+            newline = newline,
+        ))
+
+    def open_bytes(self) -> BufferedIOBase:
+        return BytesIO(self._content)
+
+
+def _read_path(openable: ReadOpenable) -> Optional[PrimitivePathType]:
+    """Returns the path opened by ``openable``, if it is known to open one.
+
+    :obj:`ReadOpenableFromPath` and objects exposing an ``open_path``
+    attribute, such as :obj:`bjec.process.FileAccessor`, are recognised.
+    """
+
+    if isinstance(openable, ReadOpenableFromPath):
+        return os.fspath(openable.path)
+
+    return cast(Optional[PrimitivePathType], getattr(openable, 'open_path', None))
+
+
+_READ_AHEAD_MAX_SIZE = 1024 * 1024
+
+_T = TypeVar('_T')
+
+def _read_ahead(
+    items: Iterable[Tuple[_T, ReadOpenable]],
+    n: int,
+    max_size: int = _READ_AHEAD_MAX_SIZE,
+) -> Iterator[Tuple[_T, ReadOpenable]]:
+    """Reads the content of the openables in ``items`` ahead of time.
+
+    Up to ``n`` openables following the one last yielded are read
+    concurrently by a pool of ``n`` threads. Openables with a known path
+    (see :func:`_read_path`) to a file of at most ``max_size`` bytes are
+    replaced by a :obj:`ReadOpenableFromBytes` holding the content. All
+    other openables are passed on unchanged.
+    """
+
+    def read(openable: ReadOpenable) -> Optional[bytes]:
+        path = _read_path(openable)
+        if path is None:
+            return None
+
+        with open(path, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > max_size:
+                return None
+            return f.read()
+
+    def result(entry: Tuple[_T, ReadOpenable, 'Future[Optional[bytes]]']) -> Tuple[_T, ReadOpenable]:
+        first, openable, future = entry
+        content = future.result()
+        if content is None:
+            return first, openable
+        return first, ReadOpenableFromBytes(content)
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        pending: Deque[Tuple[_T, ReadOpenable, 'Future[Optional[bytes]]']] = deque()
+
+        for first, openable in items:
+            pending.append((first, openable, pool.submit(read, openable)))
+            if len(pending) > n:
+                yield result(pending.popleft())
+
+        while pending:
+            yield result(pending.popleft())
+
+
 class Writeable(Protocol):
     def write_to(self, w: WriteOpenable) -> None:
         ...
@@ -197,9 +291,8 @@ class WriteableFromPath(Writeable):
         return self._path
 
     def write_to(self, w: WriteOpenable) -> None:
-        # TODO: attempt to use os.sendfile if available
         with open(self._path, 'rb') as src, w.open_bytes() as dst:
-            copyfileobj(src, dst)
+            copy_file(src, dst)
 
 
 class WriteableFromStr(Writeable):
@@ -274,3 +367,132 @@ def ensure_writeable(source: Union[Writeable, str, bytes]) -> Writeable:
         return WriteableFromBytes(source)
     else:
         return source
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+_KERNEL_COPY_MIN_SIZE = 64 * 1024
+
+# Linux transfers at most 0x7ffff000 bytes per sendfile / copy_file_range.
+_MAX_KERNEL_COPY_COUNT = 0x7ffff000
+
+_KERNEL_COPY_FALLBACK_ERRNOS = frozenset((
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF,
+))
+
+def copy_file(src: _BinaryFile, dst: _BinaryFile, chunk_size: int = _COPY_CHUNK_SIZE) -> None:
+    """Copies the remaining content of ``src`` to ``dst``.
+
+    If both files are backed by file descriptors, both are regular files and
+    ``src`` has at least 64 KiB remaining, data is copied within the kernel
+    using ``os.copy_file_range()`` or ``os.sendfile()``, avoiding copies to
+    and from user space. Otherwise, or if the kernel does not support copying
+    between the files, ``shutil.copyfileobj()`` is used with a large buffer.
+    Thus, the content of many small files is gathered in the write buffer of
+    ``dst`` and written with few system calls. For larger files, the kernel
+    is advised that ``src`` is read sequentially.
+
+    After returning, the positions of both file objects are at the end of the
+    copied data.
+
+    Args:
+        src: File to copy from.
+        dst: File to copy to.
+        chunk_size: Size of the buffer used by ``shutil.copyfileobj()`` and
+            minimum number of bytes requested per kernel copy call.
+    """
+
+    try:
+        src_fd = src.fileno()
+        dst_fd = dst.fileno()
+        offset = src.tell()
+    except (AttributeError, OSError):
+        # io.UnsupportedOperation is a subclass of OSError.
+        copyfileobj(src, dst, chunk_size)
+        return
+
+    src_stat = os.fstat(src_fd)
+    if not stat.S_ISREG(src_stat.st_mode):
+        copyfileobj(src, dst, chunk_size)
+        return
+
+    if not stat.S_ISREG(os.fstat(dst_fd).st_mode) or not dst.seekable():
+        # Kernel copies move the descriptor's position, re-synchronising the
+        # file object is not possible for pipes, sockets, etc.
+        copyfileobj(src, dst, chunk_size)
+        return
+
+    if src_stat.st_size - offset < _KERNEL_COPY_MIN_SIZE:
+        # Small files are collected in dst's write buffer, a kernel copy
+        # would require flushing dst for every file.
+        dst.write(src.read())
+        return
+
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(src_fd, offset, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+    # Request the entire remaining content at once, the loop in
+    # _kernel_copy() continues if less (or, for a growing file, more) data
+    # is available.
+    count = min(max(src_stat.st_size - offset, chunk_size), _MAX_KERNEL_COPY_COUNT)
+
+    dst.flush()
+
+    try:
+        offset, done = _kernel_copy(src_fd, dst_fd, offset, count)
+    finally:
+        src.seek(offset)
+        # Re-synchronises the file object's position with the descriptor.
+        dst.seek(os.lseek(dst_fd, 0, os.SEEK_CUR))
+
+    if not done:
+        copyfileobj(src, dst, chunk_size)
+
+def _drop_cache(fd: int) -> None:
+    """Advises the kernel that the cached pages of ``fd`` are not needed.
+
+    Only clean pages are dropped, i.e. data already written back. Any
+    errors and missing support for ``os.posix_fadvise()`` are ignored.
+    """
+
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+def _kernel_copy(src_fd: int, dst_fd: int, offset: int, count: int) -> Tuple[int, bool]:
+    """Copies from ``src_fd`` starting at ``offset`` to ``dst_fd``.
+
+    Each system call copies at most ``count`` bytes.
+
+    Returns:
+        The offset in ``src_fd`` up to which data has been copied and whether
+        the end of ``src_fd`` has been reached. The latter is ``False`` if no
+        kernel copy mechanism is supported for the descriptors.
+    """
+
+    copy_funcs: List[Callable[[int], int]] = []
+    if hasattr(os, 'copy_file_range'):
+        copy_funcs.append(lambda pos: os.copy_file_range(
+            src_fd, dst_fd, count, pos,
+        ))
+    if hasattr(os, 'sendfile'):
+        copy_funcs.append(lambda pos: os.sendfile(
+            dst_fd, src_fd, pos, count,
+        ))
+
+    for copy_func in copy_funcs:
+        try:
+            while True:
+                n = copy_func(offset)
+                if n == 0:
+                    return offset, True
+                offset += n
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+
+    return offset, False
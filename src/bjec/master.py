@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Set, Sequence, TypeVar, TYPE_CHECKING, Union
+from collections import deque
+from typing import Any, Callable, Dict, FrozenSet, Generic, Iterable, List, Optional, Set, Sequence, TypeVar, TYPE_CHECKING, Union
 
 from .utils import listify
 
@@ -120,8 +121,9 @@ class Artefactor(_RunnableMixInBase):
         self._artefact_funcs.update(kwargs)
 
     def _collect_artefacts(self) -> None:
-        for key, val in self._artefact_funcs.items():
-            self.artefacts[key] = val()
+        self._artefacts.update(
+            (key, val()) for key, val in self._artefact_funcs.items()
+        )
 
     def w_run(self) -> None:
         super(Artefactor, self).w_run()
@@ -133,16 +135,38 @@ class Registerable(_RunnableMixInBase):
     def __init__(self) -> None:
         super(Registerable, self).__init__()
         self.__masters: List[Master] = []
+        self.__resolve_cache: Dict[ResolveKey, Registerable] = {}
+        self.__resolve_cache_versions: List[int] = []
 
     def registered_with(self, master: 'Master') -> None:
         self.__masters.append(master)
+        self.__resolve_cache.clear()
+
+    def _master_versions(self) -> List[int]:
+        """Returns the versions of all masters this object is registered with.
+
+        Registrations with any master may change the resolution of keys.
+        """
+        return [m._version for m in self.__masters]
 
     def _resolve(self, key: ResolveKey) -> 'Registerable':
+            versions = self._master_versions()
+            if versions != self.__resolve_cache_versions:
+                self.__resolve_cache.clear()
+                self.__resolve_cache_versions = versions
+
+            obj = self.__resolve_cache.get(key)
+            if obj is not None:
+                return obj
+
             for m in self.__masters:
                 try:
-                    return m[key]
+                    obj = m[key]
                 except KeyError:
-                    pass
+                    continue
+
+                self.__resolve_cache[key] = obj
+                return obj
 
             raise KeyError(f'Could not resolve key {key!r}')
 
@@ -173,10 +197,10 @@ class Dependency(Registerable, _RunnableMixInBase):
             return self._obj.dependencies
 
     class _Resolver(object):
-        def __init__(self, parent: 'Dependency', resolvable: Set[Registerable]) -> None:
+        def __init__(self, parent: 'Dependency', resolvable: FrozenSet[Registerable]) -> None:
             super(Dependency._Resolver, self).__init__()
             self.__parent: Dependency = parent
-            self.__resolvable: Set[Registerable] = resolvable
+            self.__resolvable: FrozenSet[Registerable] = resolvable
 
         def __getitem__(self, key: ResolveKey) -> Registerable:
             item = self.__parent._resolve(key)
@@ -190,10 +214,13 @@ class Dependency(Registerable, _RunnableMixInBase):
         super(Dependency, self).__init__()
         self.__fulfilled: bool = False
         self.__depends: List[ResolveKey] = []
-        self.dependencies: Dependency._Resolver = Dependency._Resolver(self, set())
+        self.__resolved: Optional[List[Registerable]] = None
+        self.__resolved_versions: List[int] = []
+        self.dependencies: Dependency._Resolver = Dependency._Resolver(self, frozenset())
 
     def depends(self, *args: ResolveKey) -> None:
         self.__depends.extend(args)
+        self.__resolved = None
 
     def fulfilled(self) -> bool:
         return self.__fulfilled
@@ -201,21 +228,30 @@ class Dependency(Registerable, _RunnableMixInBase):
     def _mark_fulfilled(self) -> None:
         self.__fulfilled = True
 
-    def _fulfill_dependencies(self) -> None:
-        resolvable: Set[Registerable] = set()
+    def _resolved_dependencies(self) -> List[Registerable]:
+        versions = self._master_versions()
+        if self.__resolved is None or versions != self.__resolved_versions:
+            resolved: List[Registerable] = []
+
+            for decl in self.__depends:
+                try:
+                    resolved.append(self._resolve(decl))
+                except KeyError:
+                    raise KeyError(f'Could not resolve dependency declaration {decl!r}')
+
+            self.__resolved = resolved
+            self.__resolved_versions = versions
 
-        for decl in self.__depends:
-            try:
-                dependency = self._resolve(decl)
-            except KeyError:
-                raise KeyError(f'Could not resolve dependency declaration {decl!r}')
+        return self.__resolved
 
-            resolvable.add(dependency)
+    def _fulfill_dependencies(self) -> None:
+        resolved = self._resolved_dependencies()
 
-            if isinstance(dependency, Dependency) and not dependency.fulfilled():
+        for dependency in _topological_order(self)[:-1]:
+            if not dependency.fulfilled():
                 dependency.fulfill()
 
-        self.dependencies = self._Resolver(self, resolvable)
+        self.dependencies = self._Resolver(self, frozenset(resolved))
 
     def fulfill(self) -> None:
         """Fulfills this dependency.
@@ -244,43 +280,155 @@ class Dependency(Registerable, _RunnableMixInBase):
         self._mark_fulfilled()
 
 
+class CycleError(Exception):
+    """Raised when the declared dependencies contain a cycle."""
+
+
+_WHITE, _GRAY, _BLACK = 0, 1, 2
+
+
+def _dependency_graph(
+    roots: Iterable[Dependency],
+    skip_fulfilled: bool = True,
+) -> Dict[Dependency, List[Dependency]]:
+    """Collects the dependency graph reachable from ``roots``.
+
+    The graph is walked by an iterative depth-first search, colouring
+    objects as unvisited (white), on the current path (gray) or finished
+    (black).
+
+    Returns:
+        Mapping of each reached object to its resolved dependencies, in
+        the order the objects were first reached.
+
+    Raises:
+        CycleError: If a cycle is reachable from ``roots``.
+    """
+    def children(obj: Dependency) -> List[Dependency]:
+        return [
+            dependency for dependency in obj._resolved_dependencies()
+            if isinstance(dependency, Dependency)
+            and not (skip_fulfilled and dependency.fulfilled())
+        ]
+
+    graph: Dict[Dependency, List[Dependency]] = {}
+    color: Dict[int, int] = {}
+
+    for root in roots:
+        if color.get(id(root), _WHITE) != _WHITE:
+            continue
+
+        color[id(root)] = _GRAY
+        graph[root] = children(root)
+        stack = [(root, iter(graph[root]))]
+
+        while stack:
+            obj, it = stack[-1]
+
+            for child in it:
+                child_color = color.get(id(child), _WHITE)
+                if child_color == _GRAY:
+                    raise CycleError(
+                        f"cycle in dependencies detected: '{child!r}' is part of cycle.",
+                    )
+                elif child_color == _WHITE:
+                    color[id(child)] = _GRAY
+                    graph[child] = children(child)
+                    stack.append((child, iter(graph[child])))
+                    break
+            else:
+                color[id(obj)] = _BLACK
+                stack.pop()
+
+    return graph
+
+
+def _topological_order(root: Dependency) -> List[Dependency]:
+    """Orders the unfulfilled dependencies of ``root`` topologically.
+
+    Collects the dependency graph below ``root`` once, not descending into
+    dependencies which are already fulfilled, and orders the objects using
+    Kahn's algorithm. Every dependency is listed before the objects
+    depending on it, ``root`` is always the last element.
+
+    Raises:
+        CycleError: If the dependency graph contains a cycle.
+    """
+    graph = _dependency_graph([root])
+
+    dependents: Dict[Dependency, List[Dependency]] = {obj: [] for obj in graph}
+    in_degree: Dict[Dependency, int] = {}
+    for obj, dependencies in graph.items():
+        in_degree[obj] = len(dependencies)
+        for dependency in dependencies:
+            dependents[dependency].append(obj)
+
+    queue = deque(obj for obj, degree in in_degree.items() if degree == 0)
+    order: List[Dependency] = []
+
+    while queue:
+        obj = queue.popleft()
+        order.append(obj)
+
+        for dependent in dependents[obj]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    return order
+
+
+_FULL_NAME, _FUNC_NAME, _ALIAS = 0, 1, 2
+"""Precedence of string keys in Master, lower values take precedence."""
+
+
 class Master(object):
     def __init__(self) -> None:
         self._registry: Dict[_FunctionObject, Registerable] = {}
-        self._name_registry: Dict[str, Registerable] = {}
-        self._func_name_registry: Dict[str, Registerable] = {}
-        self._aliases: Dict[str, Registerable] = {}
+        self._lookup: Dict[ResolveKey, Registerable] = {}
+        self._key_precedence: Dict[str, int] = {}
+        self._version: int = 0
 
     def register(self, obj: Registerable, func: _FunctionObject, aliases: _OptListifyable[str]=None) -> None:
         aliases = listify(aliases, none_empty=True)
 
+        self._version += 1
         self._registry[func] = obj
-        self._name_registry[func.__module__ + "." + func.__name__] = obj
-        self._func_name_registry[func.__name__] = obj
+        self._lookup[func] = obj
+        self._add_key(func.__module__ + "." + func.__name__, obj, _FULL_NAME)
+        self._add_key(func.__name__, obj, _FUNC_NAME)
 
         for s in aliases:
-            self._aliases[s] = obj
+            self._add_key(s, obj, _ALIAS)
 
         try:
             obj.registered_with(self)
         except AttributeError:
             pass
 
+    def _add_key(self, key: str, obj: Registerable, precedence: int) -> None:
+        current = self._key_precedence.get(key)
+
+        if current is not None and current < precedence:
+            return
+
+        # For keys of the same precedence, the latest registration wins.
+        self._lookup[key] = obj
+        self._key_precedence[key] = precedence
+
+    def check_cycles(self) -> None:
+        """Checks the dependencies of all registered objects for cycles.
+
+        Raises:
+            CycleError: If the dependencies contain a cycle.
+        """
+        _dependency_graph(
+            (obj for obj in self._registry.values() if isinstance(obj, Dependency)),
+            skip_fulfilled = False,
+        )
+
     def __getitem__(self, key: ResolveKey) -> Registerable:
-        if isinstance(key, str):
-            try:
-                return self._name_registry[key]
-            except KeyError:
-                pass
-
-            try:
-                return self._func_name_registry[key]
-            except KeyError:
-                pass
-
-            return self._aliases[key]
-        else:
-            return self._registry[key]
+        return self._lookup[key]
 
 
 master = Master()
@@ -1,3 +1,4 @@
+import operator
 from os import PathLike
 from pathlib import PurePath
 from typing import (
@@ -65,44 +66,89 @@ IterableResolvable = Union[Iterable[Resolvable[_T]], Resolvable[Iterable[_T]]]
 MappingResolvable = Union[Mapping[Resolvable[_T], Resolvable[_S]], Resolvable[Mapping[_T, _S]]]
 PairsResolvable = Union[Resolvable[Iterable[Tuple[_T, _S]]], Iterable[Resolvable[Tuple[_T, _S]]], Iterable[Tuple[Resolvable[_T], Resolvable[_S]]]]
 
+def _evaluator(obj: Resolvable[_T]) -> Optional[Callable[[ParamSet], _T]]:
+    """Returns the ``evaluate_with_params`` method of ``obj`` or ``None``.
+
+    Testing for the method avoids raising and catching an ``AttributeError``
+    for every literal. Callers may also store the result to decide only once
+    whether ``obj`` has to be evaluated.
+    """
+    if isinstance(obj, type):
+        return None
+
+    return getattr(obj, 'evaluate_with_params', None)
+
+def _split_evaluables(
+    objs: Iterable[Resolvable[Any]],
+) -> Tuple[TList[Any], TList[Tuple[int, Callable[[ParamSet], Any]]]]:
+    """Splits ``objs`` into literal values and evaluators.
+
+    Returns:
+        A list of all literal values, with ``None`` in place of evaluable
+        objects, and a list of ``(index, evaluate_with_params)`` pairs for
+        the evaluable objects. Plain :class:`P` objects are evaluated by an
+        ``operator.itemgetter`` for the parameter instead.
+    """
+    literals: TList[Any] = []
+    evaluators: TList[Tuple[int, Callable[[ParamSet], Any]]] = []
+
+    for i, obj in enumerate(objs):
+        evaluate: Optional[Callable[[ParamSet], Any]]
+        if type(obj) is P:
+            evaluate = operator.itemgetter(obj._key)
+        else:
+            evaluate = _evaluator(obj)
+        if evaluate is None:
+            literals.append(obj)
+        else:
+            literals.append(None)
+            evaluators.append((i, evaluate))
+
+    return literals, evaluators
+
 def resolve(obj: Resolvable[_T], params: ParamSet) -> _T:
-    try:
-        return cast('ParamsEvaluable[_T]', obj).evaluate_with_params(params)
-    except (AttributeError, TypeError):
+    # Inlined _evaluator(), resolve() is called for every single value.
+    evaluate = None if isinstance(obj, type) else getattr(obj, 'evaluate_with_params', None)
+    if evaluate is None:
         return cast('_T', obj)
 
+    return cast('_T', evaluate(params))
+
 def resolve_iterable(it: IterableResolvable[_T], params: ParamSet) -> Iterable[_T]:
-    try:
-        return cast('ParamsEvaluable[Iterable[_T]]', it).evaluate_with_params(params)
-    except (AttributeError, TypeError):
+    evaluate = _evaluator(it)
+    if evaluate is None:
         return (resolve(el, params) for el in cast('Iterable[Resolvable[_T]]', it))
 
+    return cast('Iterable[_T]', evaluate(params))
+
 def resolve_list(it: IterableResolvable[_T], params: ParamSet) -> TList[_T]:
     return list(resolve_iterable(it, params))
 
 def resolve_mapping(m: MappingResolvable[_T, _S], params: ParamSet) -> Mapping[_T, _S]:
-    try:
-        return cast('ParamsEvaluable[Mapping[_T, _S]]', m).evaluate_with_params(params)
-    except (AttributeError, TypeError):
+    evaluate = _evaluator(m)
+    if evaluate is None:
         return {
             resolve(key, params): resolve(value, params)
             for key, value in cast('Mapping[Resolvable[_T], Resolvable[_S]]', m).items()
         }
 
+    return cast('Mapping[_T, _S]', evaluate(params))
+
 def resolve_dict(m: MappingResolvable[_T, _S], params: ParamSet) -> TDict[_T, _S]:
     return dict(resolve_mapping(m, params))
 
 def _resolve_pairs(pairs: PairsResolvable[_T, _S], params: ParamSet) -> Iterable[Tuple[_T, _S]]:
-    try:
-        return cast('ParamsEvaluable[Iterable[Tuple[_T, _S]]]', pairs).evaluate_with_params(params)
-    except (AttributeError, TypeError):
-        def f(element: Union[Resolvable[Tuple[_T, _S]], Tuple[Resolvable[_T], Resolvable[_S]]]) -> Tuple[_T, _S]:
-            if isinstance(element, tuple):
-                return (resolve(element[0], params), resolve(element[1], params))
-            else:
-                return element.evaluate_with_params(params)
+    evaluate = _evaluator(pairs)
+    if evaluate is not None:
+        return cast('Iterable[Tuple[_T, _S]]', evaluate(params))
+
+    def f(element: Union[Resolvable[Tuple[_T, _S]], Tuple[Resolvable[_T], Resolvable[_S]]]) -> Tuple[_T, _S]:
+        if isinstance(element, tuple):
+            return (resolve(element[0], params), resolve(element[1], params))
+        else:
+            return element.evaluate_with_params(params)
 
-        return map(f, cast('Union[Iterable[Resolvable[Tuple[_T, _S]]], Iterable[Tuple[Resolvable[_T], Resolvable[_S]]]]', pairs))
+    return map(f, cast('Union[Iterable[Resolvable[Tuple[_T, _S]]], Iterable[Tuple[Resolvable[_T], Resolvable[_S]]]]', pairs))
 
 
 @runtime_checkable
@@ -294,8 +340,16 @@ class Join(_IdentityMixIn, _WithMixIn[_T_sb], Generic[_T_sb]):
         self._sep: _T_sb = sep if sep is not None else cast('_T_sb', '')
         self._set_initialisers(*args, sep=self._sep)
 
+        self._literals: TList[Any]
+        self._evaluators: TList[Tuple[int, Callable[[ParamSet], Any]]]
+        self._literals, self._evaluators = _split_evaluables(args)
+
     def evaluate_with_params(self, params: ParamSet) -> _T_sb:
-        return self._sep.join(resolve_iterable(self._args, params))
+        parts = self._literals.copy()
+        for i, evaluate in self._evaluators:
+            parts[i] = evaluate(params)
+
+        return self._sep.join(parts)
 
 
 class Call(_IdentityMixIn, _WithMixIn[_T], Generic[_T]):
@@ -322,11 +376,30 @@ class Call(_IdentityMixIn, _WithMixIn[_T], Generic[_T]):
         self._kwargs: TDict[str, Resolvable[Any]] = kwargs
         self._set_initialisers(func, *args, **kwargs)
 
+        self._literal_args: TList[Any]
+        self._arg_evaluators: TList[Tuple[int, Callable[[ParamSet], Any]]]
+        self._literal_args, self._arg_evaluators = _split_evaluables(args)
+
+        literal_values, value_evaluators = _split_evaluables(kwargs.values())
+        keys = list(kwargs)
+        self._literal_kwargs: TDict[str, Any] = dict(zip(keys, literal_values))
+        self._kwarg_evaluators: TList[Tuple[str, Callable[[ParamSet], Any]]] = [
+            (keys[i], evaluate) for i, evaluate in value_evaluators
+        ]
+
     def evaluate_with_params(self, params: ParamSet) -> _T:
-        args = list(resolve_iterable(self._args, params))
-        kwargs = {
-            key: resolve(value, params) for key, value in self._kwargs.items()
-        }
+        args = self._literal_args.copy()
+        for i, evaluate in self._arg_evaluators:
+            args[i] = evaluate(params)
+
+        if not self._kwarg_evaluators:
+            # Unpacking passes a new dict to func, no copy necessary.
+            return self._func(*args, **self._literal_kwargs)
+
+        kwargs = self._literal_kwargs.copy()
+        for key, evaluate in self._kwarg_evaluators:
+            kwargs[key] = evaluate(params)
+
         return self._func(*args, **kwargs)
 
 
@@ -1,12 +1,13 @@
 from dataclasses import dataclass, field
 from io import TextIOBase, BufferedIOBase
+import operator
 from os import environ, fspath, PathLike
 from shutil import copyfileobj
 from typing import cast, Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 from typing_extensions import Protocol
 
 from .io import PathType, PrimitivePathType, resolve_abs_path, resolve_writable, Writeable, WriteableFromPath
-from .params import ensure_multi_iterable, IterableResolvable, MappingResolvable, ParamSet, resolve, resolve_iterable, resolve_mapping, Resolvable
+from .params import _split_evaluables, ensure_multi_iterable, IterableResolvable, MappingResolvable, ParamSet, resolve, resolve_iterable, resolve_mapping, Resolvable
 
 """This module provides the Process abstraction for users and implementers.
 
@@ -49,6 +50,7 @@ Todo:
 
 _EnvVar = Tuple[Resolvable[str], Resolvable[str]]
 _StackEnvVar = Tuple[Resolvable[str], Optional[Resolvable[str]]]
+_SplitArgs = Tuple[List[Any], List[Tuple[int, Callable[[ParamSet], Any]]]]
 
 _T = TypeVar('_T')
 
@@ -616,7 +618,16 @@ class Process(object):
 
         @property
         def args(self) -> List[str]:
-            return list(resolve_iterable(self._process._args, self._params))
+            split_args = self._process._split_args()
+            if split_args is None:
+                return list(resolve_iterable(self._process._args, self._params))
+
+            literals, evaluators = split_args
+            args = literals.copy()
+            for i, evaluate in evaluators:
+                args[i] = evaluate(self._params)
+
+            return args
 
         @property
         def working_directory(self) -> Optional[str]:
@@ -806,6 +817,7 @@ class Process(object):
     def __init__(self) -> None:
         self._cmd: Resolvable[str] = ''
         self._args: IterableResolvable[str] = []
+        self._split_args_cache: Optional[Tuple[Any, _SplitArgs]] = None
         self._working_directory: Optional[Resolvable[str]] = None
         environment: Dict[str, str] = {}
         self._environment: MappingResolvable[str, str] = environment
@@ -837,6 +849,22 @@ class Process(object):
     def with_params(self, params: ParamSet) -> 'Process.WithParams':
         return Process.WithParams(self, params)
 
+    def _split_args(self) -> Optional[_SplitArgs]:
+        """Returns the literal and evaluable elements of ``_args``.
+
+        The split is only computed once for tuples of arguments, as set by
+        :meth:`Fluid.args`. ``None`` is returned for all other kinds of
+        ``_args``, which have to be resolved on every evaluation.
+        """
+        args = self._args
+        if not isinstance(args, tuple):
+            return None
+
+        if self._split_args_cache is None or self._split_args_cache[0] is not args:
+            self._split_args_cache = (args, _split_evaluables(args))
+
+        return self._split_args_cache[1]
+
 
 class FileAccessor(object):
     """Represents a file accessible for reading.
@@ -929,45 +957,33 @@ Retrievable = Callable[[Result], _T]
 
 
 class _DeferredResult(object):
+    """Provides retrievables for the attributes of :class:`Result`.
+
+    The retrievables are ``operator.attrgetter`` / ``operator.methodcaller``
+    objects, which are called without creating a Python frame.
+    """
+
     @property
     def exit_code(self) -> Retrievable[int]:
-        def f(r: Result) -> int:
-            return r.exit_code
-
-        return f
+        return cast('Retrievable[int]', operator.attrgetter('exit_code'))
 
     @property
     def stdin(self) -> Retrievable[FileAccessor]:
-        def f(r: Result) -> FileAccessor:
-            return r.stdin
-
-        return f
+        return cast('Retrievable[FileAccessor]', operator.attrgetter('stdin'))
 
     @property
     def stdout(self) -> Retrievable[FileAccessor]:
-        def f(r: Result) -> FileAccessor:
-            return r.stdout
-
-        return f
+        return cast('Retrievable[FileAccessor]', operator.attrgetter('stdout'))
 
     @property
     def stderr(self) -> Retrievable[FileAccessor]:
-        def f(r: Result) -> FileAccessor:
-            return r.stderr
-
-        return f
+        return cast('Retrievable[FileAccessor]', operator.attrgetter('stderr'))
 
     def input_file(self, name: str) -> Retrievable[FileAccessor]:
-        def f(r: Result) -> FileAccessor:
-            return r.input_file(name)
-
-        return f
+        return cast('Retrievable[FileAccessor]', operator.methodcaller('input_file', name))
 
     def output_file(self, name: str) -> Retrievable[FileAccessor]:
-        def f(r: Result) -> FileAccessor:
-            return r.output_file(name)
-
-        return f
+        return cast('Retrievable[FileAccessor]', operator.methodcaller('output_file', name))
 
 
 DeferredResult = _DeferredResult()
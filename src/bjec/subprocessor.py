@@ -1,5 +1,5 @@
-from collections import ChainMap
-from concurrent.futures import ThreadPoolExecutor
+from collections import ChainMap, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
 from dataclasses import dataclass
 import functools
@@ -9,7 +9,7 @@ import subprocess
 from tempfile import mkstemp
 from threading import Lock
 from types import TracebackType
-from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
 
 from .config import config
 from .io import PrimitivePathType, WriteableFromPath, WriteOpenableFromPath
@@ -19,6 +19,10 @@ from .processor import Processor
 from .utils import CallbackOnException, HandlersCollector, HandlersList
 
 
+_T = TypeVar('_T')
+_S = TypeVar('_S')
+
+
 class _ProcessFailedError(Exception):
     pass
 
@@ -42,6 +46,7 @@ def prepare_input_file(
     cleanup_handlers: HandlersCollector,
     name: str = '',
     temp_dir: Optional[str] = None,
+    cleanup_temporary: bool = True,
 ) -> FileDescriptor:
     if spec.source is None:
         raise Exception('Invalid use, spec.source is None')
@@ -92,17 +97,9 @@ def prepare_input_file(
                 cleanup = False,
             )
         else:
-            fd, temp_file_path = mkstemp(dir=temp_dir)
+            descriptor, fd = _temporary_file(name, temp_dir, cleanup=cleanup_temporary)
             os.close(fd)
 
-            descriptor = FileDescriptor(
-                name,
-                temp_file_path,
-                temp_file_path,
-                temporary = True,
-                cleanup = True,
-            )
-
     if write_to:
         spec.source.write_to(WriteOpenableFromPath(descriptor.open_path))
 
@@ -117,6 +114,7 @@ def prepare_output_file(
     cleanup_handlers: HandlersCollector,
     name: str = '',
     temp_dir: Optional[str] = None,
+    cleanup_temporary: bool = True,
 ) -> FileDescriptor:
     if isinstance(spec, Process.Stdout) and not spec.capture:
         raise Exception('Invalid use, spec.capture is False')
@@ -158,17 +156,9 @@ def prepare_output_file(
             path = spec.path,
         )
     else:
-        fd, temp_file_path = mkstemp(dir=temp_dir)
+        descriptor, fd = _temporary_file(name, temp_dir, cleanup=cleanup_temporary)
         os.close(fd)
 
-        descriptor = FileDescriptor(
-            name,
-            temp_file_path,
-            temp_file_path,
-            temporary = True,
-            cleanup = True,
-        )
-
     if isinstance(spec, Process.OutputFile) and not spec.create:
         try:
             os.unlink(descriptor.open_path)
@@ -180,6 +170,27 @@ def prepare_output_file(
 
     return descriptor
 
+def _temporary_file(
+    name: str, temp_dir: Optional[str] = None, cleanup: bool = True,
+) -> Tuple[FileDescriptor, int]:
+    """Creates a temporary file, returning its descriptor and an open fd.
+
+    The fd is open for reading and writing and must be closed by the caller.
+    If ``cleanup`` is ``False``, the caller is responsible for removing the
+    file, e.g. along with ``temp_dir``.
+    """
+    fd, temp_file_path = mkstemp(dir=temp_dir)
+
+    descriptor = FileDescriptor(
+        name,
+        temp_file_path,
+        temp_file_path,
+        temporary = True,
+        cleanup = cleanup,
+    )
+
+    return descriptor, fd
+
 def _get_umask() -> int:
     current_umask = os.umask(0o022)
     os.umask(current_umask)
@@ -191,6 +202,35 @@ def _path_to_str(path: PrimitivePathType) -> str:
     else:
         return os.fsdecode(path)
 
+def _bounded_map(
+    pool: ThreadPoolExecutor,
+    fn: Callable[[_T], _S],
+    it: Iterable[_T],
+    max_pending: int,
+) -> Iterator[_S]:
+    """Like ``pool.map``, but only keeps ``max_pending`` tasks submitted.
+
+    ``Executor.map`` consumes ``it`` entirely and creates a future for
+    every element before returning. Here, elements are taken from ``it`` as
+    results are consumed, so that a large or lazy ``it`` is not
+    materialised at once.
+    """
+    it = iter(it)
+    pending: Deque['Future[_S]'] = deque(
+        pool.submit(fn, item) for item in itertools.islice(it, max_pending)
+    )
+
+    try:
+        while pending:
+            future = pending.popleft()
+            for item in itertools.islice(it, 1):
+                pending.append(pool.submit(fn, item))
+
+            yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
 
 class Subprocessor(Processor[Result]):
     """Subprocessor runs Process executions concurrently using threads.
@@ -200,6 +240,11 @@ class Subprocessor(Processor[Result]):
             concurrently. If ``<= 0``, the configuration option of the same
             name is used instead. ``1`` is used if the configuration option is
             not set.
+        priority: Function computing the priority of a parameter set, e.g.
+            its estimated runtime. If set, all parameter sets are retrieved
+            up front and started in order of descending priority, so that
+            long running processes do not end up delaying completion. Results
+            are returned in this order as well.
 
     Configuration Options:
 
@@ -219,7 +264,11 @@ class Subprocessor(Processor[Result]):
             execute further ones.
     """
 
-    def __init__(self, max_processes: int=0) -> None:
+    def __init__(
+        self,
+        max_processes: int = 0,
+        priority: Optional[Callable[[ParamSet], Any]] = None,
+    ) -> None:
         super(Subprocessor, self).__init__()
         if max_processes <= 0:
             max_processes = config[Subprocessor].get('max_processes', 1)
@@ -227,7 +276,8 @@ class Subprocessor(Processor[Result]):
                 raise ValueError('Invalid value for max_processes retrieved (<= 0)')
 
         self._max_processes: int = max_processes
-        self._pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_processes)
+        self._priority: Optional[Callable[[ParamSet], Any]] = priority
+        self._pool: Optional[ThreadPoolExecutor] = None
 
         self._cleanup_handlers: HandlersList = HandlersList()
         self._cleanup_handlers_lock: Lock = Lock()
@@ -237,7 +287,9 @@ class Subprocessor(Processor[Result]):
         return self._max_processes
 
     def __exit__(self, *args: Any) -> Optional[bool]:
-        self._pool.shutdown(wait=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
 
         with self._cleanup_handlers_lock:
             self._cleanup_handlers()
@@ -253,7 +305,16 @@ class Subprocessor(Processor[Result]):
 
         native_runnable = _ProcessRunner(self, runnable)
 
-        return self._pool.map(native_runnable.run, params_it)
+        if self._priority is not None:
+            params_it = sorted(params_it, key=self._priority, reverse=True)
+
+        # The pool is kept until __exit__, threads are reused across calls.
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_processes)
+
+        return _bounded_map(
+            self._pool, native_runnable.run, params_it, 2 * self._max_processes,
+        )
 
 
 class _ProcessRunner(object):
@@ -303,23 +364,28 @@ class _ProcessRunner(object):
             with ExitStack() as stack:
                 p = self._process.with_params(params)
 
+                # Each access to a WithParams property resolves the spec anew.
+                stdin_spec = p.stdin
+                stdout_spec = p.stdout
+                stderr_spec = p.stderr
+
                 stdin: int = subprocess.DEVNULL
                 stdin_descriptor: Optional[FileDescriptor] = None
-                if p.stdin.connected:
+                if stdin_spec.connected:
                     stdin_descriptor, stdin = self._prepare_stdin(
-                        p.stdin, stack, cleanup_handlers,
+                        stdin_spec, stack, cleanup_handlers,
                     )
                 stdout: int = subprocess.DEVNULL
                 stdout_descriptor: Optional[FileDescriptor] = None
-                if p.stdout.capture:
+                if stdout_spec.capture:
                     stdout_descriptor, stdout = self._prepare_stdout(
-                        p.stdout, stack, cleanup_handlers,
+                        stdout_spec, stack, cleanup_handlers,
                     )
                 stderr: int = subprocess.DEVNULL
                 stderr_descriptor: Optional[FileDescriptor] = None
-                if p.stderr.capture:
+                if stderr_spec.capture:
                     stderr_descriptor, stderr = self._prepare_stdout(
-                        p.stderr, stack, cleanup_handlers, name='stderr',
+                        stderr_spec, stack, cleanup_handlers, name='stderr',
                     )
 
                 input_files: List[FileDescriptor] = [
@@ -338,8 +404,12 @@ class _ProcessRunner(object):
                     for file in all_file_descriptors
                 }, params))
 
+                # p.args returns a fresh list, the command is prepended in place.
+                argv = p.args
+                argv.insert(0, p.cmd)
+
                 s = subprocess.Popen(
-                    [p.cmd] + p.args,
+                    argv,
                     cwd = p.working_directory,
                     env = p.environment,
                     stdin = stdin,
@@ -385,6 +455,13 @@ class _ProcessRunner(object):
         cleanup_handlers: HandlersCollector,
         name: str = 'stdout',
     ) -> Tuple[FileDescriptor, int]:
+        if spec.path is None:
+            # Write to the fd returned by mkstemp instead of reopening the file.
+            descriptor, fd = _temporary_file(name)
+            exit_handlers.callback(os.close, fd)
+            cleanup_handlers.callback(lambda: os.unlink(descriptor.open_path))
+            return descriptor, fd
+
         descriptor = prepare_output_file(spec, exit_handlers, cleanup_handlers, name=name)
         fd = os.open(descriptor.open_path, os.O_WRONLY|os.O_TRUNC)
         exit_handlers.callback(os.close, fd)
@@ -1,4 +1,5 @@
 import collections
+import collections.abc
 import datetime
 import functools
 import itertools
@@ -18,13 +19,20 @@ def listify(obj: Union[_T, Sequence[_T], None], none_empty: bool=False) -> List[
         ``obj`` is ``None``.
     """
 
+    # Exact type checks first, these are the common cases.
+    obj_type = type(obj)
+    if obj_type is list:
+        return cast('List[_T]', obj)
+    elif obj_type is tuple:
+        return list(cast('Sequence[_T]', obj))
+
     if obj is None and none_empty:
         return []
     elif isinstance(obj, list):
         return obj
     elif isinstance(obj, (str, bytes)):
         return [cast(_T, obj)]
-    elif isinstance(obj, Sequence):
+    elif isinstance(obj, collections.abc.Sequence):
         return list(obj)
     else:
         return [cast(_T, obj)]
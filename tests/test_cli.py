@@ -0,0 +1,45 @@
+import os
+from tempfile import TemporaryDirectory
+import zipfile
+
+from bjec.cli import _run_path
+
+
+def test_run_path_cached() -> None:
+    with TemporaryDirectory() as d:
+        cache_dir = os.path.join(d, 'cache')
+        path = os.path.join(d, 'bjec.py')
+        with open(path, 'w') as f:
+            f.write('x = 1\n')
+
+        result = _run_path(path, cache_dir)
+        assert result['x'] == 1
+        assert result['__file__'] == path
+        assert result['__name__'] == '<run_path>'
+        assert len(os.listdir(cache_dir)) == 1
+
+        assert _run_path(path, cache_dir)['x'] == 1
+
+        with open(path, 'w') as f:
+            f.write('x = 22\n')
+
+        assert _run_path(path, cache_dir)['x'] == 22
+        assert len(os.listdir(cache_dir)) == 1
+
+
+def test_run_path_main() -> None:
+    with TemporaryDirectory() as d:
+        cache_dir = os.path.join(d, 'cache')
+        main_dir = os.path.join(d, 'main')
+        os.mkdir(main_dir)
+        with open(os.path.join(main_dir, '__main__.py'), 'w') as f:
+            f.write('x = 1\n')
+
+        assert _run_path(main_dir, cache_dir)['x'] == 1
+
+        zip_path = os.path.join(d, 'main.zip')
+        with zipfile.ZipFile(zip_path, 'w') as z:
+            z.writestr('__main__.py', 'x = 2\n')
+
+        assert _run_path(zip_path, cache_dir)['x'] == 2
+        assert not os.path.exists(cache_dir)
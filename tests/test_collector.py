@@ -1,6 +1,12 @@
-from typing import cast
+from io import BytesIO
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+import os
+import pytest # type: ignore[import]
+from typing import Any, cast, Iterable, List, Tuple
 
-from bjec.collector import Collector, Noop
+from bjec.collector import Collector, Concatenate, Demux, Multi, Noop
+from bjec.io import ReadOpenable, ReadOpenableFromPath, WriteableFromBytes
+from bjec.params import Join, P, ParamSet
 
 def typing_test_variance() -> None:
     """Statically test that type var variance works as expected.
@@ -30,3 +36,136 @@ def typing_test_variance() -> None:
     # This should work: The collector exepcts all written results to be
     # instances of A. An instance of B is also an instance of A.
     write_to_collector_of_b(cast('Collector[A]', Noop()))
+
+def test_concatenate() -> None:
+    with TemporaryDirectory() as d, NamedTemporaryFile() as f:
+        for name in ('a', 'b'):
+            with open(os.path.join(d, name), 'wb') as input_file:
+                input_file.write(b'content ' + name.encode() + b'\n')
+
+        with Concatenate(
+            path = f.name,
+            before_all = b'begin\n',
+            after_all = 'end\n',
+            before = b'> ',
+            after = Join('< ', P('name'), '\n'),
+        ) as c:
+            c.collect(
+                ({'name': name}, ReadOpenableFromPath(os.path.join(d, name)))
+                for name in ('a', 'b')
+            )
+
+        assert f.read() == b'begin\n> content a\n< a\n> content b\n< b\nend\n'
+
+
+class _Recorder(Collector[Any]):
+    def __init__(self, params: ParamSet) -> None:
+        self.params: ParamSet = params
+        self.results: List[Any] = []
+
+    def collect(self, results: Iterable[Tuple[ParamSet, Any]]) -> None:
+        self.results.extend(result for _, result in results)
+
+def test_demux() -> None:
+    recorders: List[_Recorder] = []
+
+    def factory(params: ParamSet) -> _Recorder:
+        recorder = _Recorder(params)
+        recorders.append(recorder)
+        return recorder
+
+    results = [
+        ({'a': 1, 'b': 1, 'c': 1}, 0),
+        ({'a': 1, 'b': 2, 'c': 1}, 1),
+        ({'a': 1, 'b': 1, 'c': 2}, 2),
+    ]
+
+    for keys, expected in [
+        ([], [({}, [0, 1, 2])]),
+        (['b'], [({'b': 1}, [0, 2]), ({'b': 2}, [1])]),
+        (['b', 'c'], [({'b': 1, 'c': 1}, [0]), ({'b': 2, 'c': 1}, [1]), ({'b': 1, 'c': 2}, [2])]),
+    ]:
+        recorders.clear()
+        with Demux(keys, factory) as demux:
+            demux.collect(results)
+
+        assert [(r.params, r.results) for r in recorders] == expected
+
+def test_multi() -> None:
+    results = [({'a': i}, i) for i in range(5)]
+
+    for batch_size in [1, 2, 64]:
+        for parallel in [False, True]:
+            a, b, c = _Recorder({}), _Recorder({}), _Recorder({})
+            with Multi(a, b, c, batch_size=batch_size, parallel=parallel) as multi:
+                multi.collect(iter(results))
+
+            assert a.results == [0, 1, 2, 3, 4]
+            assert b.results == [0, 1, 2, 3, 4]
+            assert c.results == [0, 1, 2, 3, 4]
+
+def test_demux_workers() -> None:
+    recorders: List[_Recorder] = []
+
+    def factory(params: ParamSet) -> _Recorder:
+        recorder = _Recorder(params)
+        recorders.append(recorder)
+        return recorder
+
+    with Demux(['b'], factory, workers=2) as demux:
+        demux.collect(({'b': i % 3}, i) for i in range(30))
+
+    assert [(r.params, r.results) for r in recorders] == [
+        ({'b': b}, list(range(b, 30, 3))) for b in range(3)
+    ]
+
+def test_demux_workers_error() -> None:
+    class _Failing(Collector[Any]):
+        def collect(self, results: Iterable[Tuple[ParamSet, Any]]) -> None:
+            raise ValueError('failed')
+
+    with pytest.raises(ValueError, match='failed'):
+        with Demux(['b'], lambda params: _Failing(), workers=2) as demux:
+            demux.collect(({'b': i % 3}, i) for i in range(3))
+
+def test_multi_enter_failure() -> None:
+    exited: List[str] = []
+
+    class _Tracking(Noop[Any]):
+        def __init__(self, name: str) -> None:
+            self.name: str = name
+
+        def __enter__(self) -> '_Tracking':
+            if self.name == 'fail':
+                raise ValueError('failed')
+            return self
+
+        def __exit__(self, *args: Any) -> None:
+            exited.append(self.name)
+
+    with pytest.raises(ValueError):
+        with Multi(_Tracking('a'), _Tracking('b'), _Tracking('fail')):
+            pass
+
+    assert exited == ['b', 'a']
+
+class _BytesOpenable(object):
+    def __init__(self, content: bytes) -> None:
+        self._content: bytes = content
+
+    def open_bytes(self) -> BytesIO:
+        return BytesIO(self._content)
+
+def test_concatenate_drop_cache() -> None:
+    with TemporaryDirectory() as d, NamedTemporaryFile() as f:
+        path = os.path.join(d, 'a')
+        with open(path, 'wb') as input_file:
+            input_file.write(b'a' * 100000)
+
+        with Concatenate(path=f.name, before_all=WriteableFromBytes(b'['), after=b'\n', drop_cache=True) as c:
+            c.collect([
+                ({}, ReadOpenableFromPath(path)),
+                ({}, cast(ReadOpenable, _BytesOpenable(b'b'))),
+            ])
+
+        assert f.read() == b'[' + b'a' * 100000 + b'\nb\n'
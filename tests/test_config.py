@@ -0,0 +1,50 @@
+import pytest # type: ignore[import]
+from tempfile import NamedTemporaryFile
+
+from bjec.config import Config
+
+
+class Module(object):
+    pass
+
+
+def test_module_config() -> None:
+    config = Config()
+
+    assert config[Module] is config[Module]
+    assert config[Module()] is config[Module]
+    assert config['test_config.Module'].key_parts == config[Module].key_parts
+    assert config[Module].key_parts == ('test_config', 'Module')
+    assert config['bjec.build.Make'].key_parts == ('build', 'Make')
+    assert 'option' not in config[Module]
+    assert config[Module].get('option', 1) == 1
+
+    with NamedTemporaryFile('wt', suffix='.yaml') as f:
+        f.write('test_config:\n  Module:\n    option: 2\n')
+        f.flush()
+        config.read_yaml(f.name)
+
+    assert 'option' in config[Module]
+    assert config[Module]['option'] == 2
+
+def test_module_config_errors() -> None:
+    config = Config()
+
+    with NamedTemporaryFile('wt', suffix='.yaml') as f:
+        f.write('a:\n  b: 1\n  c:\n    d: null\n')
+        f.flush()
+        config.read_yaml(f.name)
+
+    assert config['a.c']['d'] is None
+    assert config['a.c'].get('d', 1) is None
+    assert config['a.b'].get('d', 1) == 1
+    assert 'd' not in config['a.b']
+
+    with pytest.raises(KeyError, match='not in config'):
+        config['a.c']['e']
+    with pytest.raises(KeyError, match='not in config'):
+        config['a.x']['e']
+    with pytest.raises(KeyError, match='does not resolve to a dict'):
+        config['a.b']['e']
+    with pytest.raises(KeyError, match='does not resolve to a dict'):
+        config['a.b.x']['e']
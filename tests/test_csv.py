@@ -1,11 +1,13 @@
+from csv import reader as csv_reader
 from io import BufferedIOBase, BytesIO, TextIOBase, TextIOWrapper
+import os
 import pytest # type: ignore[import]
-from tempfile import NamedTemporaryFile
-from typing import cast, Iterable, Optional, Tuple
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from typing import Any, cast, Dict, Iterable, List, Optional, Tuple
 
 from bjec import csv
-from bjec.io import ReadOpenable
-from bjec.params import P
+from bjec.io import ReadOpenable, ReadOpenableFromPath
+from bjec.params import P, ParamSet
 
 input_a = b"""scenario,rate
 simple,0.34
@@ -157,3 +159,145 @@ def test_before_after_headers() -> None:
             ])
 
         assert f.read() == output_before_after_headers
+
+def test_copy_verbatim() -> None:
+    with NamedTemporaryFile() as f:
+        with csv.Collector(
+            path = f.name,
+            copy_verbatim = True,
+        ) as c:
+            c.collect([
+                ({}, ReadOpenableFromBytes(input_a)),
+                ({}, ReadOpenableFromBytes(input_b)),
+            ])
+
+        assert f.read() == output_simple
+
+    with NamedTemporaryFile() as f:
+        with csv.Collector(
+            path = f.name,
+            before_all = [['before_all']],
+            manage_headers = True,
+            before_header_row = [P('input')],
+            copy_verbatim = True,
+        ) as c:
+            c.collect([
+                ({'input': 'a'}, ReadOpenableFromBytes(input_a)),
+                ({'input': 'b'}, ReadOpenableFromBytes(input_b.rstrip())),
+                ({'input': 'c'}, ReadOpenableFromBytes(b'')),
+            ])
+
+        assert f.read() == b'a,scenario,rate\r\nbefore_all\r\n' + output_simple_headers[len(b'scenario,rate\r\n'):]
+
+    with pytest.raises(Exception):
+        csv.Collector(before_row=[P('input')], input_csv_args={'escapechar': '\\'}, copy_verbatim=True)
+    with pytest.raises(Exception):
+        csv.Collector(output_encoding='utf-16', copy_verbatim=True)
+    with pytest.raises(Exception, match='ASCII-compatible'):
+        csv.Collector(input_encoding='utf-16', output_encoding='utf-16', copy_verbatim=True)
+    csv.Collector(input_encoding='latin-1', output_encoding='latin-1', copy_verbatim=True)
+
+def test_copy_verbatim_before_after() -> None:
+    with NamedTemporaryFile() as f:
+        with csv.Collector(
+            path = f.name,
+            before_all = [['before_all_0_0'], ['before_all_1_0']],
+            after_all = [['after_all_0_0'], ['after_all_1_0']],
+            before = [['before_0', P('input')], ['before_1']],
+            after = [['after_0', P('input')], ['after_1']],
+            before_row = [P('input')],
+            after_row = [P('input')],
+            manage_headers = True,
+            before_header_row = ['before_header'],
+            after_header_row = ['after_header'],
+            copy_verbatim = True,
+        ) as c:
+            c.collect([
+                ({'input': 'a'}, ReadOpenableFromBytes(input_a)),
+                ({'input': 'b'}, ReadOpenableFromBytes(input_b)),
+            ])
+
+        assert f.read() == output_before_after_headers
+
+    multi_line = b'x,"1\r\n2",y\r\n\r\n"""q""",z'
+    with NamedTemporaryFile() as f_verbatim, NamedTemporaryFile() as f_parsed:
+        for path, copy_verbatim in ((f_verbatim.name, True), (f_parsed.name, False)):
+            with csv.Collector(
+                path = path,
+                before_row = ['a b'],
+                after_row = ['c,d'],
+                copy_verbatim = copy_verbatim,
+            ) as c:
+                c.collect([({}, ReadOpenableFromBytes(multi_line))])
+
+        assert f_verbatim.read() == f_parsed.read()
+
+    # A quote within an unquoted field does not open a quoted field.
+    inner_quote = b'x"y,z\nq,r\n'
+    with NamedTemporaryFile() as f_verbatim, NamedTemporaryFile() as f_parsed:
+        for path, copy_verbatim in ((f_verbatim.name, True), (f_parsed.name, False)):
+            with csv.Collector(
+                path = path,
+                before_row = ['B'],
+                after_row = ['A'],
+                copy_verbatim = copy_verbatim,
+            ) as c:
+                c.collect([({}, ReadOpenableFromBytes(inner_quote))])
+
+        verbatim_rows = list(csv_reader(TextIOWrapper(f_verbatim, newline='')))
+        parsed_rows = list(csv_reader(TextIOWrapper(f_parsed, newline='')))
+        assert verbatim_rows == parsed_rows == [['B', 'x"y', 'z', 'A'], ['B', 'q', 'r', 'A']]
+
+    # Spans several blocks, only some of which are spliced as a whole.
+    rows = [b'%d,simple,0.%d' % (i, i) for i in range(30000)]
+    rows[20000] = b'x,"1\r\n2",y'
+    rows[25000] = b''
+    many_rows = b'\r\n'.join(rows)
+    with NamedTemporaryFile() as f_verbatim, NamedTemporaryFile() as f_parsed:
+        for path, copy_verbatim in ((f_verbatim.name, True), (f_parsed.name, False)):
+            with csv.Collector(
+                path = path,
+                before_row = ['a'],
+                after_row = ['b', 'c'],
+                copy_verbatim = copy_verbatim,
+            ) as c:
+                c.collect([({}, ReadOpenableFromBytes(many_rows))])
+
+        assert f_verbatim.read() == f_parsed.read()
+
+def test_copy_verbatim_terminator() -> None:
+    # The last line terminator of the input is appended to an unterminated
+    # last row, the output dialect's only if the input has none.
+    cases: List[Tuple[Dict[str, Any], bytes, bytes]] = [
+        ({}, b'a,b\nc,d', b'a,b\nc,d\n'),
+        ({}, b'a,b', b'a,b\r\n'),
+        ({'before_row': ['x'], 'after_row': ['y']}, b'a,b\nc,d', b'x,a,b,y\nx,c,d,y\n'),
+        ({'before_row': ['x']}, b'a,b\n"c\r\nd"', b'x,a,b\nx,"c\r\nd"\n'),
+        ({'after_row': ['y']}, b'a,b', b'a,b,y\r\n'),
+    ]
+    for kwargs, content, expected in cases:
+        with NamedTemporaryFile() as f:
+            with csv.Collector(path=f.name, copy_verbatim=True, **kwargs) as c:
+                c.collect([({}, ReadOpenableFromBytes(content))])
+
+            assert f.read() == expected
+
+def test_read_ahead() -> None:
+    with TemporaryDirectory() as d, NamedTemporaryFile() as f_ahead, NamedTemporaryFile() as f:
+        inputs: List[Tuple[ParamSet, ReadOpenable]] = []
+        for i, content in enumerate([input_a, input_b] * 5):
+            path = os.path.join(d, str(i))
+            with open(path, 'wb') as input_file:
+                input_file.write(content)
+            inputs.append(({}, ReadOpenableFromPath(path)))
+        inputs.append(({}, ReadOpenableFromBytes(input_a)))
+
+        for path, read_ahead in ((f_ahead.name, 3), (f.name, 0)):
+            with csv.Collector(
+                path = path,
+                manage_headers = True,
+                read_ahead = read_ahead,
+            ) as c:
+                c.collect(inputs)
+
+        assert f_ahead.read() == f.read() != b''
@@ -0,0 +1,68 @@
+import pytest # type: ignore[import]
+
+from bjec.generator import Chain, FromIterable, Literal, Matrix, Product, Repeat
+
+def test_matrix() -> None:
+    assert list(Matrix(a=[1, 2], b=['x', 'y'])) == [
+        {'a': 1, 'b': 'x'},
+        {'a': 1, 'b': 'y'},
+        {'a': 2, 'b': 'x'},
+        {'a': 2, 'b': 'y'},
+    ]
+    assert list(Matrix(**{"it's": [1]})) == [{"it's": 1}]
+    assert list(Matrix()) == [{}]
+
+def test_matrix_batches() -> None:
+    m = Matrix(a=[1, 2, 3], b=['x', 'y'])
+
+    assert list(m.batches(4)) == [
+        {'a': (1, 1, 2, 2), 'b': ('x', 'y', 'x', 'y')},
+        {'a': (3, 3), 'b': ('x', 'y')},
+    ]
+    assert list(m.batches(6)) == [
+        {'a': (1, 1, 2, 2, 3, 3), 'b': ('x', 'y', 'x', 'y', 'x', 'y')},
+    ]
+
+    with pytest.raises(ValueError):
+        m.batches(0)
+
+def test_product() -> None:
+    p = Product(Matrix(a=[1, 2]), Literal(b='x', c='y'), Matrix(c=['z']))
+
+    assert list(p) == [
+        {'a': 1, 'b': 'x', 'c': 'z'},
+        {'a': 2, 'b': 'x', 'c': 'z'},
+    ]
+    assert list(p) == list(p)
+
+    p = Product(Chain(Literal(a=1, b=2), Literal(b=3, a=4), Literal(c=5)), Matrix(d=[6, 7]))
+
+    assert list(p) == [
+        {'a': 1, 'b': 2, 'd': 6},
+        {'a': 1, 'b': 2, 'd': 7},
+        {'b': 3, 'a': 4, 'd': 6},
+        {'b': 3, 'a': 4, 'd': 7},
+        {'c': 5, 'd': 6},
+        {'c': 5, 'd': 7},
+    ]
+
+    assert list(Product(Literal(a=1), Matrix(b=[]))) == []
+
+def test_repeat() -> None:
+    assert list(Repeat(Matrix(a=[1, 2]), 3)) == [
+        {'a': 1}, {'a': 1}, {'a': 1}, {'a': 2}, {'a': 2}, {'a': 2},
+    ]
+    assert list(Repeat(Matrix(a=[1, 2]), 0)) == []
+    assert list(Repeat(Matrix(a=[1, 2]), 1)) == [{'a': 1}, {'a': 2}]
+
+def test_len() -> None:
+    m = Matrix(a=[1, 2, 3], b=['x', 'y'])
+    p = Product(m, Chain(Literal(c=1), Repeat(Matrix(c=[2, 3]), 2)))
+
+    assert len(m) == 6
+    assert len(p) == len(list(p)) == 30
+    assert len(Product()) == 1
+    assert len(FromIterable([{}, {}])) == 2
+
+    with pytest.raises(TypeError):
+        len(Chain(Literal(), FromIterable(iter([{}]))))
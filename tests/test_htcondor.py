@@ -1,5 +1,12 @@
 
-from bjec.htcondor import _args_to_str, _environment_to_str, _file_remaps_to_str
+import os
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Iterator, List
+
+from classad import ClassAd
+
+from bjec.htcondor import _args_to_str, _chunks, _environment_to_str, _file_remaps_to_str, _JobClusterGenerator, _JobState, HTCondor, Job
+from bjec.process import Process
 
 def test_args_to_str() -> None:
 	"""
@@ -48,3 +55,72 @@ def test_file_remaps_to_str() -> None:
 	assert _file_remaps_to_str({'a': 'b', 'c': '/d/d'}) == '"a=b;c=/d/d"'
 	assert _file_remaps_to_str({'a': 'b b'}) == '"a=b b"'
 	assert _file_remaps_to_str({'a;a=a': 'b;b=b'}) == '"a;a\\=a=b\\;b=b"'
+
+class _FakeSchedd(object):
+	def __init__(self, polls: List[List[int]]) -> None:
+		self._polls: Iterator[List[int]] = iter(polls)
+		self._statuses: List[int] = []
+		self.queried: List[int] = []
+
+	def xquery(self, projection: List[str], **kwargs: Any) -> Iterator[Dict[str, Any]]:
+		if 'ExitCode' in projection:
+			self.queried.append(len(self._statuses))
+		else:
+			self._statuses = next(self._polls)
+
+		return iter([
+			{'ClusterId': 1, 'ProcId': proc_id, 'JobStatus': status, 'ExitCode': 0}
+			for proc_id, status in enumerate(self._statuses)
+		])
+
+def test_poll_completed() -> None:
+	schedd = _FakeSchedd([[1, 1, 2], [2, 4, 2], [2, 4, 2], [4, 4, 4]])
+	htcondor = HTCondor(schedd=schedd, poll_interval=0) # type: ignore[arg-type]
+
+	completed = list(htcondor._poll_completed(1))
+
+	assert [state.proc_id for state in completed] == [1, 0, 2]
+	assert all(state.exit_code == 0 for state in completed)
+	assert len(schedd.queried) == 2
+
+def test_chunks() -> None:
+	params = [{'n': n} for n in range(5)]
+
+	assert list(_chunks(params, 2)) == [params[0:2], params[2:4], params[4:5]]
+	assert list(_chunks(params, 5)) == [params]
+	assert list(_chunks([], 3)) == []
+
+def test_job_state_from_class_ad() -> None:
+	state = _JobState.from_class_ad(ClassAd(
+		'[ClusterId = 1; ProcId = 2; JobStatus = 4; ExitBySignal = true; ExitSignal = 9]',
+	))
+	assert (state.cluster_id, state.proc_id) == (1, 2)
+	assert state.exit_by_signal
+	assert state.exit_signal == 9
+
+	state = _JobState.from_class_ad(ClassAd(
+		'[ClusterId = 1; ProcId = 2; JobStatus = 4; ExitBySignal = false; ExitCode = 3]',
+	))
+	assert not state.exit_by_signal
+	assert state.exit_code == 3
+
+def test_cluster_temp_dir() -> None:
+	process = Process.Fluid().cmd('echo').connect_stdin(b'in').capture_stdout().add_input_file('f', b'data').build()
+
+	with TemporaryDirectory() as temp_dir:
+		for transfer in (False, True):
+			job = Job.Fluid().process(process).transfer_files(transfer).build()
+			htcondor = HTCondor(schedd=object(), temp_dir=temp_dir) # type: ignore[arg-type]
+
+			with _JobClusterGenerator(htcondor, job, [{}, {}]) as cluster_generator:
+				items = list(cluster_generator)
+
+			assert os.path.dirname(cluster_generator.temp_dir) == temp_dir
+			assert all(
+				os.path.dirname(item[key]) == cluster_generator.temp_dir
+				for item in items for key in ('input', 'output', 'log')
+			)
+			assert list(cluster_generator.cleanup_handlers) == []
+			assert len(os.listdir(cluster_generator.temp_dir)) == 7
+
+		assert len(os.listdir(temp_dir)) == 2
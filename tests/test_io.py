@@ -0,0 +1,72 @@
+from io import BytesIO
+import os
+from tempfile import TemporaryFile
+from threading import Thread
+from typing import List
+
+from bjec.io import copy_file
+
+content = bytes(range(256)) * 8192
+
+def test_copy_file() -> None:
+    with TemporaryFile() as src, TemporaryFile() as dst:
+        src.write(content)
+        src.seek(10)
+        dst.write(b'head')
+
+        copy_file(src, dst)
+        dst.write(b'tail')
+
+        assert src.tell() == len(content)
+        assert dst.tell() == 4 + len(content) - 10 + 4
+
+        dst.seek(0)
+        assert dst.read() == b'head' + content[10:] + b'tail'
+
+def test_copy_file_without_fileno() -> None:
+    src = BytesIO(content)
+    with TemporaryFile() as dst:
+        copy_file(src, dst)
+
+        dst.seek(0)
+        assert dst.read() == content
+
+    dst_bytes = BytesIO()
+    with TemporaryFile() as src_file:
+        src_file.write(content)
+        src_file.seek(0)
+        copy_file(src_file, dst_bytes)
+
+    assert dst_bytes.getvalue() == content
+
+def test_copy_file_small() -> None:
+    with TemporaryFile() as src, TemporaryFile() as dst:
+        src.write(content[:100])
+        src.seek(0)
+        dst.write(b'head')
+
+        copy_file(src, dst)
+        dst.write(b'tail')
+
+        assert src.tell() == 100
+        dst.seek(0)
+        assert dst.read() == b'head' + content[:100] + b'tail'
+
+def test_copy_file_to_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    received: List[bytes] = []
+
+    def read() -> None:
+        with open(read_fd, 'rb') as r:
+            received.append(r.read())
+
+    reader = Thread(target=read)
+    reader.start()
+
+    with TemporaryFile() as src, open(write_fd, 'wb') as dst:
+        src.write(content)
+        src.seek(0)
+        copy_file(src, dst)
+
+    reader.join()
+    assert received == [content]
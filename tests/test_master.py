@@ -0,0 +1,119 @@
+import pytest # type: ignore[import]
+from typing import List
+
+from bjec.master import CycleError, Dependency, Master, Runnable, WrapperRun
+
+
+class _Node(Dependency, WrapperRun, Runnable):
+    def __init__(self, name: str, runs: List[str]) -> None:
+        super(_Node, self).__init__()
+        self.name: str = name
+        self._runs: List[str] = runs
+
+    def _run(self) -> None:
+        self._runs.append(self.name)
+
+
+def _register(master: Master, node: _Node) -> None:
+    def func() -> None:
+        pass
+    func.__name__ = node.name
+
+    master.register(node, func)
+
+def test_diamond() -> None:
+    master = Master()
+    runs: List[str] = []
+
+    nodes = {name: _Node(name, runs) for name in ('root', 'left', 'right', 'base')}
+    nodes['root'].depends('left', 'right')
+    nodes['left'].depends('base')
+    nodes['right'].depends('base')
+    for node in nodes.values():
+        _register(master, node)
+
+    master.check_cycles()
+    nodes['root'].run()
+
+    assert runs == ['base', 'left', 'right', 'root']
+    assert nodes['root'].dependencies['left'] is nodes['left']
+    with pytest.raises(KeyError):
+        nodes['root'].dependencies['base']
+
+    nodes['root'].run()
+    assert runs == ['base', 'left', 'right', 'root']
+
+def test_cycle() -> None:
+    master = Master()
+    runs: List[str] = []
+
+    a, b = _Node('a', runs), _Node('b', runs)
+    a.depends('b')
+    b.depends('a')
+    _register(master, a)
+    _register(master, b)
+
+    with pytest.raises(CycleError, match='cycle'):
+        master.check_cycles()
+    with pytest.raises(CycleError, match='cycle'):
+        a.run()
+    assert runs == []
+
+def test_keys() -> None:
+    master = Master()
+    runs: List[str] = []
+
+    a, b, c = _Node('a', runs), _Node('b', runs), _Node('c', runs)
+
+    def func() -> None:
+        pass
+    func.__module__ = 'x'
+    master.register(a, func, aliases=['alias', 'y.func'])
+
+    def other_func() -> None:
+        pass
+    other_func.__name__ = 'func'
+    other_func.__module__ = 'y'
+    master.register(b, other_func)
+
+    assert master[func] is a
+    assert master[other_func] is b
+    assert master['x.func'] is a
+    assert master['y.func'] is b
+    assert master['alias'] is a
+    # As for all keys of the same precedence, the latest registration wins.
+    assert master['func'] is b
+    with pytest.raises(KeyError):
+        master['z']
+
+    master.register(c, func)
+    assert master[func] is c
+    assert master['x.func'] is c
+
+def test_resolve_after_register() -> None:
+    master = Master()
+    runs: List[str] = []
+
+    a, b = _Node('a', runs), _Node('b', runs)
+    _register(master, a)
+    assert a._resolve('a') is a
+    with pytest.raises(KeyError):
+        a._resolve('b')
+
+    _register(master, b)
+    assert a._resolve('b') is b
+    assert a._resolve('b') is b
+
+def test_dependencies_after_register() -> None:
+    master = Master()
+    runs: List[str] = []
+
+    a, b, c = _Node('a', runs), _Node('b', runs), _Node('c', runs)
+    a.depends('b')
+    _register(master, a)
+    _register(master, b)
+    assert a._resolved_dependencies() == [b]
+
+    c.name = 'b'
+    _register(master, c)
+    assert a._resolved_dependencies() == [c]
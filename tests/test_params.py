@@ -0,0 +1,15 @@
+from bjec.params import Call, Join, P
+
+def test_join() -> None:
+    join = Join('out.', P('n'), '.', P('m'), '.csv')
+
+    assert join.evaluate_with_params({'n': '1', 'm': 'a'}) == 'out.1.a.csv'
+    assert join.evaluate_with_params({'n': '2', 'm': 'b'}) == 'out.2.b.csv'
+    assert Join(b'a', P('b'), sep=b'-').evaluate_with_params({'b': b'b'}) == b'a-b'
+
+def test_call() -> None:
+    call = Call(lambda *args, **kwargs: (args, kwargs), 1, P('a'), b=P('b'), c=3, d=Join('x', P('a')))
+
+    assert call.evaluate_with_params({'a': 'y', 'b': 2}) == ((1, 'y'), {'b': 2, 'c': 3, 'd': 'xy'})
+    assert call.evaluate_with_params({'a': 'z', 'b': 4}) == ((1, 'z'), {'b': 4, 'c': 3, 'd': 'xz'})
+    assert Call(lambda x: [x], P).evaluate_with_params({}) == [P]
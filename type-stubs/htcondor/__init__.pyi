@@ -31,6 +31,39 @@ class JobAction(Enum):
     VacateFast = ...
 
 
+class JobEventType(Enum):
+    SUBMIT = ...
+    EXECUTE = ...
+    JOB_TERMINATED = ...
+    JOB_ABORTED = ...
+    JOB_HELD = ...
+    JOB_RELEASED = ...
+
+
+class JobEvent(Mapping[str, Any]):
+    type: JobEventType
+    cluster: int
+    proc: int
+    timestamp: int
+
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, k: str) -> Any: ...
+
+
+class JobEventLog:
+    def __init__(self, filename: str) -> None: ...
+    def events(self, stop_after: Optional[int] = ...) -> Iterator[JobEvent]: ...
+    def close(self) -> None: ...
+    def __enter__(self) -> 'JobEventLog': ...
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_val: Optional[BaseException] = None,
+        exc_tb: Optional[TracebackType] = None,
+    ) -> Optional[bool]: ...
+
+
 class Transaction:
     def __enter__(self) -> 'Transaction': ...
     def __exit__(